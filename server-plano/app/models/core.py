@@ -3,7 +3,7 @@ Core data models for the intelligent timeline and budget system.
 """
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence
 from decimal import Decimal
 
 from .enums import (
@@ -12,7 +12,16 @@ from .enums import (
 )
 
 
-@dataclass
+# Integer codes for dependency types, used to index the CPM coefficient tables
+DEPENDENCY_TYPE_CODES = {
+    "finish_to_start": 0,
+    "start_to_start": 1,
+    "finish_to_finish": 2,
+    "start_to_finish": 3,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Location:
     """Location information for events"""
     city: str
@@ -20,6 +29,13 @@ class Location:
     country: str
     timezone: str
     coordinates: Optional[tuple] = None
+    # Lowercased city/country, derived once for the case-insensitive lookups in the services
+    city_key: str = field(init=False, repr=False, compare=False)
+    country_key: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, 'city_key', (self.city or "").lower())
+        object.__setattr__(self, 'country_key', (self.country or "").lower())
     
     def validate(self) -> List[str]:
         """Validate location data"""
@@ -35,7 +51,7 @@ class Location:
         return errors
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventContext:
     """Context information for event planning"""
     event_type: EventType
@@ -81,6 +97,10 @@ class Dependency:
     successor_id: str
     dependency_type: str  # "finish_to_start", "start_to_start", etc.
     lag_time: timedelta = timedelta(0)
+    type_code: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.type_code = DEPENDENCY_TYPE_CODES.get(self.dependency_type, -1)
     
     def validate(self) -> List[str]:
         """Validate dependency data"""
@@ -91,7 +111,7 @@ class Dependency:
             errors.append("Successor ID is required")
         if self.predecessor_id == self.successor_id:
             errors.append("Activity cannot depend on itself")
-        if self.dependency_type not in ["finish_to_start", "start_to_start", "finish_to_finish", "start_to_finish"]:
+        if self.dependency_type not in DEPENDENCY_TYPE_CODES:
             errors.append("Invalid dependency type")
         return errors
 
@@ -323,13 +343,13 @@ class BudgetAllocation:
         return errors
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CriticalFactor:
     """Critical factor affecting event planning"""
     name: str
     impact_level: Priority
     description: str
-    mitigation_strategies: List[str] = field(default_factory=list)
+    mitigation_strategies: Sequence[str] = field(default_factory=list)
     
     def validate(self) -> List[str]:
         """Validate critical factor data"""
@@ -4,7 +4,18 @@ Enums for categorical data in the intelligent timeline and budget system.
 from enum import Enum
 
 
-class VenueType(Enum):
+class _IdentityHashEnum(Enum):
+    """
+    Enum base whose members hash by identity.
+    
+    Members are singletons compared by identity, so this is equivalent to the
+    default name-based hash but runs in C, which speeds up the enum-keyed lookup
+    tables used throughout the services.
+    """
+    __hash__ = object.__hash__
+
+
+class VenueType(_IdentityHashEnum):
     """Types of venues for events"""
     INDOOR = "indoor"
     OUTDOOR = "outdoor"
@@ -20,7 +31,7 @@ class VenueType(Enum):
     COMMUNITY_CENTER = "community_center"
 
 
-class BudgetTier(Enum):
+class BudgetTier(_IdentityHashEnum):
     """Budget tiers for different service levels"""
     LOW = "low"
     STANDARD = "standard"
@@ -28,7 +39,7 @@ class BudgetTier(Enum):
     LUXURY = "luxury"
 
 
-class Season(Enum):
+class Season(_IdentityHashEnum):
     """Seasons affecting event planning"""
     SPRING = "spring"
     SUMMER = "summer"
@@ -37,7 +48,7 @@ class Season(Enum):
     WINTER = "winter"
 
 
-class EventType(Enum):
+class EventType(_IdentityHashEnum):
     """Types of events supported"""
     WEDDING = "wedding"
     BIRTHDAY = "birthday"
@@ -51,7 +62,7 @@ class EventType(Enum):
     CONFERENCE = "conference"
 
 
-class CulturalRequirement(Enum):
+class CulturalRequirement(_IdentityHashEnum):
     """Cultural and religious requirements"""
     HINDU = "hindu"
     MUSLIM = "muslim"
@@ -64,7 +75,7 @@ class CulturalRequirement(Enum):
     MIXED = "mixed"
 
 
-class ActivityType(Enum):
+class ActivityType(_IdentityHashEnum):
     """Types of activities in timeline"""
     CEREMONY = "ceremony"
     PREPARATION = "preparation"
@@ -78,7 +89,7 @@ class ActivityType(Enum):
     NETWORKING = "networking"
 
 
-class BudgetCategory(Enum):
+class BudgetCategory(_IdentityHashEnum):
     """Budget allocation categories"""
     VENUE = "venue"
     CATERING = "catering"
@@ -95,7 +106,7 @@ class BudgetCategory(Enum):
     CONTINGENCY = "contingency"
 
 
-class Priority(Enum):
+class Priority(_IdentityHashEnum):
     """Priority levels for activities and budget items"""
     CRITICAL = "critical"
     HIGH = "high"
@@ -104,7 +115,14 @@ class Priority(Enum):
     OPTIONAL = "optional"
 
 
-class WeatherCondition(Enum):
+# Rank of each priority (0 = critical) in declaration order, so priority ordering
+# can read an int straight off the member
+for _rank, _priority in enumerate(Priority):
+    _priority.rank = _rank
+del _rank, _priority
+
+
+class WeatherCondition(_IdentityHashEnum):
     """Weather conditions affecting outdoor events"""
     SUNNY = "sunny"
     CLOUDY = "cloudy"
@@ -115,7 +133,7 @@ class WeatherCondition(Enum):
     HUMID = "humid"
 
 
-class AccessibilityRequirement(Enum):
+class AccessibilityRequirement(_IdentityHashEnum):
     """Accessibility requirements for events"""
     WHEELCHAIR_ACCESS = "wheelchair_access"
     HEARING_ASSISTANCE = "hearing_assistance"
@@ -519,7 +519,7 @@ class BudgetAllocationEngine:
     
     def _get_regional_multiplier(self, location: 'Location') -> float:
         """Get regional cost multiplier based on location."""
-        city_key = location.city.lower()
+        city_key = location.city_key
         
         # Check if city is in our regional multipliers
         if city_key in self.REGIONAL_MULTIPLIERS:
@@ -537,8 +537,7 @@ class BudgetAllocationEngine:
             "thailand": 1.0     # Thailand is moderate
         }
         
-        country_key = location.country.lower()
-        return country_defaults.get(country_key, 0.8)  # Default for unknown countries
+        return country_defaults.get(location.country_key, 0.8)  # Default for unknown countries
     
     def _apply_seasonal_adjustments(
         self, 
@@ -5,13 +5,21 @@ Handles dependency graphs, critical path calculation, and buffer time allocation
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict, deque
+from collections import deque
 import heapq
 
 from app.models.core import Activity, Dependency, TimedActivity, EventContext
 from app.models.enums import Priority
 
 
+# CPM coefficients indexed by Dependency.type_code
+# (finish_to_start, start_to_start, finish_to_finish, start_to_finish).
+# Forward: (use predecessor finish, sign applied to the successor's duration)
+FORWARD_COEFFS = ((1, 0), (0, 0), (1, -1), (0, -1))
+# Backward: (use successor latest finish, sign applied to the predecessor's duration)
+BACKWARD_COEFFS = ((0, 0), (0, 1), (1, 0), (1, 1))
+
+
 @dataclass
 class DependencyNode:
     """Node in the dependency graph representing an activity"""
@@ -37,11 +45,28 @@ class DependencyGraph:
     dependencies: List[Dependency] = field(default_factory=list)
     critical_path: List[str] = field(default_factory=list)
     total_duration: timedelta = timedelta(0)
+    # Bumped on every structural edit so derived results can be reused until the graph changes
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _order_cache: Optional[Tuple[int, List[int]]] = field(default=None, init=False, repr=False, compare=False)
+    _cpm_key: Optional[Tuple[int, datetime]] = field(default=None, init=False, repr=False, compare=False)
+    # Activity ids interned to int indices; adjacency holds (neighbour index, dependency) pairs
+    _id_to_idx: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _idx_to_id: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _node_by_idx: List[DependencyNode] = field(default_factory=list, init=False, repr=False, compare=False)
+    _preds: List[List[Tuple[int, Dependency]]] = field(default_factory=list, init=False, repr=False, compare=False)
+    _succs: List[List[Tuple[int, Dependency]]] = field(default_factory=list, init=False, repr=False, compare=False)
     
     def add_activity(self, activity: Activity) -> None:
         """Add an activity to the dependency graph"""
         if activity.id not in self.nodes:
-            self.nodes[activity.id] = DependencyNode(activity=activity)
+            node = DependencyNode(activity=activity)
+            self.nodes[activity.id] = node
+            self._id_to_idx[activity.id] = len(self._idx_to_id)
+            self._idx_to_id.append(activity.id)
+            self._node_by_idx.append(node)
+            self._preds.append([])
+            self._succs.append([])
+            self._version += 1
     
     def add_dependency(self, dependency: Dependency) -> None:
         """Add a dependency between activities"""
@@ -58,55 +83,57 @@ class DependencyGraph:
         
         # Add to graph
         self.dependencies.append(dependency)
+        successor_node = self.nodes[dependency.successor_id]
+        if dependency.predecessor_id not in successor_node.predecessors:
+            # Only the first dependency between a pair of activities drives scheduling
+            pred_idx = self._id_to_idx[dependency.predecessor_id]
+            succ_idx = self._id_to_idx[dependency.successor_id]
+            self._succs[pred_idx].append((succ_idx, dependency))
+            self._preds[succ_idx].append((pred_idx, dependency))
         self.nodes[dependency.predecessor_id].successors.add(dependency.successor_id)
-        self.nodes[dependency.successor_id].predecessors.add(dependency.predecessor_id)
+        successor_node.predecessors.add(dependency.predecessor_id)
+        self._version += 1
     
     def has_cycle(self) -> bool:
-        """Check if the dependency graph has cycles using DFS"""
-        WHITE, GRAY, BLACK = 0, 1, 2
-        colors = {node_id: WHITE for node_id in self.nodes}
-        
-        def dfs(node_id: str) -> bool:
-            if colors[node_id] == GRAY:
-                return True  # Back edge found, cycle detected
-            if colors[node_id] == BLACK:
-                return False  # Already processed
-            
-            colors[node_id] = GRAY
-            for successor_id in self.nodes[node_id].successors:
-                if dfs(successor_id):
-                    return True
-            colors[node_id] = BLACK
-            return False
-        
-        for node_id in self.nodes:
-            if colors[node_id] == WHITE:
-                if dfs(node_id):
-                    return True
-        return False
+        """Check if the dependency graph has cycles"""
+        return len(self._kahn_order()) != len(self._idx_to_id)
     
-    def topological_sort(self) -> List[str]:
-        """Return activities in topological order"""
-        if self.has_cycle():
-            raise ValueError("Cannot perform topological sort: dependency graph has cycles")
+    def _kahn_order(self) -> List[int]:
+        """Kahn's algorithm over interned indices (memoized per graph version).
         
-        in_degree = {node_id: len(node.predecessors) for node_id, node in self.nodes.items()}
-        queue = deque([node_id for node_id, degree in in_degree.items() if degree == 0])
-        result = []
+        Returns fewer indices than there are nodes when the graph has a cycle.
+        """
+        if self._order_cache is not None and self._order_cache[0] == self._version:
+            return self._order_cache[1]
+        
+        succs = self._succs
+        in_degree = [len(preds) for preds in self._preds]
+        queue = deque([idx for idx, degree in enumerate(in_degree) if degree == 0])
+        order = []
         
         while queue:
-            node_id = queue.popleft()
-            result.append(node_id)
+            idx = queue.popleft()
+            order.append(idx)
             
-            for successor_id in self.nodes[node_id].successors:
-                in_degree[successor_id] -= 1
-                if in_degree[successor_id] == 0:
-                    queue.append(successor_id)
-        
-        if len(result) != len(self.nodes):
-            raise ValueError("Topological sort failed: dependency graph has cycles")
+            for succ_idx, _ in succs[idx]:
+                in_degree[succ_idx] -= 1
+                if in_degree[succ_idx] == 0:
+                    queue.append(succ_idx)
         
-        return result
+        self._order_cache = (self._version, order)
+        return order
+    
+    def _topological_indices(self) -> List[int]:
+        """Return interned activity indices in topological order"""
+        order = self._kahn_order()
+        if len(order) != len(self._idx_to_id):
+            raise ValueError("Cannot perform topological sort: dependency graph has cycles")
+        return order
+    
+    def topological_sort(self) -> List[str]:
+        """Return activities in topological order"""
+        idx_to_id = self._idx_to_id
+        return [idx_to_id[idx] for idx in self._topological_indices()]
 
 
 class DependencyManager:
@@ -269,14 +296,19 @@ class DependencyManager:
     
     def calculate_critical_path(self, graph: DependencyGraph, start_time: datetime) -> None:
         """Calculate critical path using CPM (Critical Path Method)"""
+        # CPM results live on the nodes; skip the passes if the graph is unchanged since the last run
+        cpm_key = (graph._version, start_time)
+        if graph._cpm_key == cpm_key:
+            return
+        
         if graph.has_cycle():
             raise ValueError("Cannot calculate critical path: dependency graph has cycles")
         
         # Forward pass - calculate earliest start and finish times
-        self._forward_pass(graph, start_time)
+        project_end = self._forward_pass(graph, start_time)
         
         # Backward pass - calculate latest start and finish times
-        self._backward_pass(graph)
+        self._backward_pass(graph, project_end)
         
         # Calculate slack and identify critical activities
         self._calculate_slack(graph)
@@ -285,96 +317,66 @@ class DependencyManager:
         graph.critical_path = self._find_critical_path(graph)
         
         # Calculate total project duration
-        if graph.nodes:
-            max_finish = max(node.earliest_finish for node in graph.nodes.values() if node.earliest_finish)
-            graph.total_duration = max_finish - start_time
+        graph.total_duration = project_end - start_time
+        
+        graph._cpm_key = cpm_key
     
-    def _forward_pass(self, graph: DependencyGraph, start_time: datetime) -> None:
-        """Forward pass to calculate earliest start and finish times"""
+    def _forward_pass(self, graph: DependencyGraph, start_time: datetime) -> datetime:
+        """Forward pass to calculate earliest start and finish times, returning the project end"""
         # Get activities in topological order
-        topo_order = graph.topological_sort()
+        topo_order = graph._topological_indices()
+        nodes = graph._node_by_idx
+        project_end = start_time
         
-        for activity_id in topo_order:
-            node = graph.nodes[activity_id]
+        for idx in topo_order:
+            node = nodes[idx]
+            total_duration = node.total_duration()
             
-            if not node.predecessors:
-                # No predecessors, can start at project start time
-                node.earliest_start = start_time
-            else:
-                # Calculate earliest start based on predecessors
-                earliest_start = start_time
-                
-                for pred_id in node.predecessors:
-                    pred_node = graph.nodes[pred_id]
-                    
-                    # Find the dependency to get lag time
-                    dependency = next(
-                        (d for d in graph.dependencies 
-                         if d.predecessor_id == pred_id and d.successor_id == activity_id),
-                        None
-                    )
-                    
-                    if dependency:
-                        if dependency.dependency_type == "finish_to_start":
-                            candidate_start = pred_node.earliest_finish + dependency.lag_time
-                        elif dependency.dependency_type == "start_to_start":
-                            candidate_start = pred_node.earliest_start + dependency.lag_time
-                        elif dependency.dependency_type == "finish_to_finish":
-                            candidate_start = pred_node.earliest_finish + dependency.lag_time - node.total_duration()
-                        else:  # start_to_finish
-                            candidate_start = pred_node.earliest_start + dependency.lag_time - node.total_duration()
-                        
-                        earliest_start = max(earliest_start, candidate_start)
+            # Calculate earliest start based on predecessors (project start if there are none)
+            earliest_start = start_time
+            
+            for pred_idx, dependency in graph._preds[idx]:
+                pred_node = nodes[pred_idx]
+                use_finish, duration_sign = FORWARD_COEFFS[dependency.type_code]
+                anchor = pred_node.earliest_finish if use_finish else pred_node.earliest_start
+                candidate_start = anchor + dependency.lag_time + total_duration * duration_sign
                 
-                node.earliest_start = earliest_start
+                earliest_start = max(earliest_start, candidate_start)
+            
+            node.earliest_start = earliest_start
             
             # Calculate earliest finish
-            node.earliest_finish = node.earliest_start + node.total_duration()
+            node.earliest_finish = earliest_start + total_duration
+            if node.earliest_finish > project_end:
+                project_end = node.earliest_finish
+        
+        return project_end
     
-    def _backward_pass(self, graph: DependencyGraph) -> None:
+    def _backward_pass(self, graph: DependencyGraph, project_end: datetime) -> None:
         """Backward pass to calculate latest start and finish times"""
         # Get activities in reverse topological order
-        topo_order = list(reversed(graph.topological_sort()))
-        
-        # Find project end time
-        project_end = max(node.earliest_finish for node in graph.nodes.values() if node.earliest_finish)
+        topo_order = reversed(graph._topological_indices())
+        nodes = graph._node_by_idx
         
-        for activity_id in topo_order:
-            node = graph.nodes[activity_id]
+        for idx in topo_order:
+            node = nodes[idx]
+            total_duration = node.total_duration()
             
-            if not node.successors:
-                # No successors, latest finish is project end
-                node.latest_finish = project_end
-            else:
-                # Calculate latest finish based on successors
-                latest_finish = project_end
-                
-                for succ_id in node.successors:
-                    succ_node = graph.nodes[succ_id]
-                    
-                    # Find the dependency to get lag time
-                    dependency = next(
-                        (d for d in graph.dependencies 
-                         if d.predecessor_id == activity_id and d.successor_id == succ_id),
-                        None
-                    )
-                    
-                    if dependency:
-                        if dependency.dependency_type == "finish_to_start":
-                            candidate_finish = succ_node.latest_start - dependency.lag_time
-                        elif dependency.dependency_type == "start_to_start":
-                            candidate_finish = succ_node.latest_start - dependency.lag_time + node.total_duration()
-                        elif dependency.dependency_type == "finish_to_finish":
-                            candidate_finish = succ_node.latest_finish - dependency.lag_time
-                        else:  # start_to_finish
-                            candidate_finish = succ_node.latest_finish - dependency.lag_time + node.total_duration()
-                        
-                        latest_finish = min(latest_finish, candidate_finish)
+            # Calculate latest finish based on successors (project end if there are none)
+            latest_finish = project_end
+            
+            for succ_idx, dependency in graph._succs[idx]:
+                succ_node = nodes[succ_idx]
+                use_finish, duration_sign = BACKWARD_COEFFS[dependency.type_code]
+                anchor = succ_node.latest_finish if use_finish else succ_node.latest_start
+                candidate_finish = anchor - dependency.lag_time + total_duration * duration_sign
                 
-                node.latest_finish = latest_finish
+                latest_finish = min(latest_finish, candidate_finish)
+            
+            node.latest_finish = latest_finish
             
             # Calculate latest start
-            node.latest_start = node.latest_finish - node.total_duration()
+            node.latest_start = latest_finish - total_duration
     
     def _calculate_slack(self, graph: DependencyGraph) -> None:
         """Calculate slack time for each activity"""
@@ -385,17 +387,15 @@ class DependencyManager:
     
     def _find_critical_path(self, graph: DependencyGraph) -> List[str]:
         """Find the critical path through the network"""
-        critical_activities = [
-            activity_id for activity_id, node in graph.nodes.items() 
-            if node.is_critical
-        ]
+        nodes = graph._node_by_idx
+        starts = [node.earliest_start or datetime.min for node in nodes]
+        critical_indices = [idx for idx, node in enumerate(nodes) if node.is_critical]
         
         # Sort critical activities by earliest start time
-        critical_activities.sort(
-            key=lambda aid: graph.nodes[aid].earliest_start or datetime.min
-        )
+        critical_indices.sort(key=starts.__getitem__)
         
-        return critical_activities
+        idx_to_id = graph._idx_to_id
+        return [idx_to_id[idx] for idx in critical_indices]
     
     def calculate_buffer_time(self, 
                             activity: Activity, 
@@ -473,28 +473,35 @@ class DependencyManager:
         """Check for resource conflicts between activities"""
         conflicts = []
         
-        # Group activities by required vendors
-        vendor_activities = defaultdict(list)
-        for activity_id, node in graph.nodes.items():
+        # Flatten (vendor rank, start, activity) entries and sort once; each vendor's
+        # activities end up adjacent and ordered by earliest start time. Vendors are
+        # ranked by first appearance so conflicts are reported in activity order.
+        vendor_ranks = {}
+        entries = []
+        for idx, node in enumerate(graph._node_by_idx):
+            start_key = node.earliest_start or datetime.min
             for vendor in node.activity.required_vendors:
-                vendor_activities[vendor].append((activity_id, node))
-        
-        # Check for time overlaps for same vendor
-        for vendor, activities in vendor_activities.items():
-            if len(activities) > 1:
-                # Sort by earliest start time
-                activities.sort(key=lambda x: x[1].earliest_start or datetime.min)
-                
-                for i in range(len(activities) - 1):
-                    current_id, current_node = activities[i]
-                    next_id, next_node = activities[i + 1]
-                    
-                    if (current_node.earliest_finish and next_node.earliest_start and
-                        current_node.earliest_finish > next_node.earliest_start):
-                        conflicts.append(
-                            f"Vendor '{vendor}' conflict between activities "
-                            f"'{current_node.activity.name}' and '{next_node.activity.name}'"
-                        )
+                rank = vendor_ranks.setdefault(vendor, len(vendor_ranks))
+                entries.append((rank, start_key, idx))
+        entries.sort()
+        vendors = list(vendor_ranks)
+        
+        # Check for time overlaps between consecutive activities of the same vendor
+        nodes = graph._node_by_idx
+        for i in range(1, len(entries)):
+            rank, _, current_idx = entries[i - 1]
+            if entries[i][0] != rank:
+                continue
+            
+            vendor = vendors[rank]
+            current_node = nodes[current_idx]
+            next_node = nodes[entries[i][2]]
+            if (current_node.earliest_finish and next_node.earliest_start and
+                current_node.earliest_finish > next_node.earliest_start):
+                conflicts.append(
+                    f"Vendor '{vendor}' conflict between activities "
+                    f"'{current_node.activity.name}' and '{next_node.activity.name}'"
+                )
         
         return conflicts
     
@@ -588,9 +595,14 @@ class DependencyManager:
             activity_issues = node.activity.validate()
             issues.extend([f"Activity '{node.activity.name}': {issue}" for issue in activity_issues])
         
-        # Validate dependencies
+        # Validate dependencies; repeated links between the same activities are checked once
+        dependency_issues_by_key = {}
         for dependency in graph.dependencies:
-            dependency_issues = dependency.validate()
-            issues.extend([f"Dependency: {issue}" for issue in dependency_issues])
+            key = (dependency.predecessor_id, dependency.successor_id, dependency.dependency_type)
+            dependency_issues = dependency_issues_by_key.get(key)
+            if dependency_issues is None:
+                dependency_issues = [f"Dependency: {issue}" for issue in dependency.validate()]
+                dependency_issues_by_key[key] = dependency_issues
+            issues.extend(dependency_issues)
         
         return issues
\ No newline at end of file
@@ -5,6 +5,10 @@ This module analyzes event parameters to determine complexity, requirements, and
 that influence timeline generation and budget allocation.
 """
 import math
+from bisect import bisect_left
+from dataclasses import replace
+from functools import lru_cache
+from itertools import repeat
 from typing import List, Dict, Tuple
 from datetime import datetime, date
 
@@ -15,6 +19,619 @@ from ..models.enums import (
 )
 
 
+# City tiers used by the regional and location analyses (lowercase)
+_METRO_CITIES = frozenset({
+    "mumbai", "delhi", "bangalore", "chennai", "kolkata", "hyderabad", "pune", "ahmedabad"
+})
+# Regional cost/logistics considerations have not been extended to Ahmedabad
+_REGIONAL_METRO_CITIES = _METRO_CITIES - {"ahmedabad"}
+_TIER2_CITIES = frozenset({
+    "jaipur", "lucknow", "kanpur", "nagpur", "indore", "bhopal", "visakhapatnam", "patna"
+})
+
+# Mitigation strategies shared by every CriticalFactor of the same kind
+_MONSOON_RISK_MITIGATION = (
+    "Arrange waterproof tenting",
+    "Identify indoor backup venue",
+    "Plan flexible timeline with weather buffers",
+    "Communicate backup plans to all vendors",
+)
+_RAIN_CONTINGENCY_MITIGATION = (
+    "Rent covered areas or tents",
+    "Prepare indoor activity alternatives",
+    "Ensure proper drainage at venue",
+)
+_LARGE_SCALE_MITIGATION = (
+    "Hire professional event coordinator",
+    "Implement guest flow management system",
+    "Arrange multiple entry/exit points",
+    "Plan staggered arrival times",
+    "Ensure adequate parking and transportation",
+)
+_MEDIUM_SCALE_MITIGATION = (
+    "Designate area coordinators",
+    "Plan clear signage and directions",
+    "Arrange sufficient seating and facilities",
+)
+_MULTI_CULTURAL_MITIGATION = (
+    "Consult with cultural experts for each tradition",
+    "Plan separate ceremony spaces if needed",
+    "Coordinate timing to respect all traditions",
+    "Ensure dietary requirements are met for all cultures",
+)
+_HINDU_TIMING_MITIGATION = (
+    "Consult with priest for auspicious timing",
+    "Prepare all ritual items in advance",
+    "Ensure proper ceremony space setup",
+    "Plan for extended ceremony duration",
+)
+_EXTENDED_DURATION_MITIGATION = (
+    "Plan daily setup and cleanup schedules",
+    "Arrange accommodation for out-of-town guests",
+    "Coordinate vendor schedules across multiple days",
+    "Plan guest energy management and breaks",
+)
+_ACCESSIBILITY_MITIGATION = (
+    "Verify venue accessibility features",
+    "Arrange specialized transportation if needed",
+    "Plan accessible seating arrangements",
+    "Coordinate with accessibility service providers",
+)
+_BUDGET_MISMATCH_MITIGATION = (
+    "Prioritize essential elements",
+    "Consider reducing guest count or duration",
+    "Explore cost-effective alternatives",
+    "Focus on high-impact, low-cost elements",
+)
+_OVER_BUDGET_MITIGATION = (
+    "Focus on premium quality over quantity",
+    "Invest in memorable experiences",
+    "Consider upgrading key elements like venue or catering",
+)
+_VENUE_CAPACITY_MITIGATION = (
+    "Verify venue capacity before booking",
+    "Plan efficient space utilization",
+    "Consider multiple areas or levels",
+    "Arrange overflow areas if needed",
+)
+
+
+# Venues exposed to the weather, for weather-related critical factors
+_WEATHER_EXPOSED_VENUES = frozenset({
+    VenueType.OUTDOOR, VenueType.BEACH, VenueType.GARDEN, VenueType.HYBRID
+})
+
+# Critical factors without per-event details are immutable and shared across calls
+_MONSOON_RISK_FACTOR = CriticalFactor(
+    name="Monsoon Weather Risk",
+    impact_level=Priority.CRITICAL,
+    description="High risk of rain disrupting outdoor activities",
+    mitigation_strategies=_MONSOON_RISK_MITIGATION
+)
+_RAIN_CONTINGENCY_FACTOR = CriticalFactor(
+    name="Rain Contingency",
+    impact_level=Priority.HIGH,
+    description="Potential rain could affect outdoor setup and guest comfort",
+    mitigation_strategies=_RAIN_CONTINGENCY_MITIGATION
+)
+_MEDIUM_SCALE_FACTOR = CriticalFactor(
+    name="Medium Scale Coordination",
+    impact_level=Priority.HIGH,
+    description="Significant coordination needed for guest management",
+    mitigation_strategies=_MEDIUM_SCALE_MITIGATION
+)
+_MULTI_CULTURAL_FACTOR = CriticalFactor(
+    name="Multi-Cultural Coordination",
+    impact_level=Priority.HIGH,
+    description="Balancing multiple cultural requirements and traditions",
+    mitigation_strategies=_MULTI_CULTURAL_MITIGATION
+)
+_HINDU_TIMING_FACTOR = CriticalFactor(
+    name="Hindu Ceremony Timing",
+    impact_level=Priority.HIGH,
+    description="Hindu ceremonies require specific timing and ritual sequences",
+    mitigation_strategies=_HINDU_TIMING_MITIGATION
+)
+_ACCESSIBILITY_FACTOR = CriticalFactor(
+    name="Accessibility Compliance",
+    impact_level=Priority.HIGH,
+    description="Ensuring event is accessible to all guests with special needs",
+    mitigation_strategies=_ACCESSIBILITY_MITIGATION
+)
+_BUDGET_MISMATCH_FACTOR = CriticalFactor(
+    name="Budget-Complexity Mismatch",
+    impact_level=Priority.HIGH,
+    description="High complexity event with low budget may compromise quality",
+    mitigation_strategies=_BUDGET_MISMATCH_MITIGATION
+)
+_OVER_BUDGET_FACTOR = CriticalFactor(
+    name="Over-budgeting Risk",
+    impact_level=Priority.MEDIUM,
+    description="Simple event with luxury budget may lead to unnecessary expenses",
+    mitigation_strategies=_OVER_BUDGET_MITIGATION
+)
+
+
+# Critical factors that embed event details are built from these templates and memoized
+# per distinct value, since the same guest counts and durations recur across requests
+_LARGE_SCALE_DESC = "Managing {} guests requires extensive coordination".format
+_EXTENDED_DURATION_DESC = "{}-day event requires sustained coordination".format
+_VENUE_CAPACITY_DESC = "Event requires approximately {} sq ft for {} guests".format
+
+
+@lru_cache(maxsize=1024)
+def _large_scale_factor(guest_count: int) -> CriticalFactor:
+    return CriticalFactor(
+        name="Large Scale Logistics",
+        impact_level=Priority.CRITICAL,
+        description=_LARGE_SCALE_DESC(guest_count),
+        mitigation_strategies=_LARGE_SCALE_MITIGATION
+    )
+
+
+@lru_cache(maxsize=256)
+def _extended_duration_factor(duration_days: int) -> CriticalFactor:
+    return CriticalFactor(
+        name="Extended Event Duration",
+        impact_level=Priority.HIGH,
+        description=_EXTENDED_DURATION_DESC(duration_days),
+        mitigation_strategies=_EXTENDED_DURATION_MITIGATION
+    )
+
+
+@lru_cache(maxsize=1024)
+def _venue_capacity_factor(required_space: int, guest_count: int) -> CriticalFactor:
+    return CriticalFactor(
+        name="Venue Capacity Planning",
+        impact_level=Priority.HIGH,
+        description=_VENUE_CAPACITY_DESC(required_space, guest_count),
+        mitigation_strategies=_VENUE_CAPACITY_MITIGATION
+    )
+
+
+# Venue impact analysis by venue type; beach venues carry the outdoor entries plus their own
+_OUTDOOR_SETUP = (
+    "Weather protection (tents/canopies)",
+    "Ground covering/flooring",
+    "Portable facilities (restrooms, power)",
+    "Lighting arrangements",
+    "Sound system with weather protection",
+)
+_OUTDOOR_LOGISTICS = (
+    "Weather contingency planning",
+    "Extended setup/breakdown time",
+    "Equipment transportation challenges",
+    "Guest comfort in outdoor conditions",
+)
+_OUTDOOR_VENUE_IMPACT = {
+    "setup_requirements": _OUTDOOR_SETUP,
+    "logistics_considerations": _OUTDOOR_LOGISTICS,
+    "cost_implications": (
+        "Additional rental costs for weather protection",
+        "Higher insurance requirements",
+        "Extended vendor time for setup",
+        "Backup venue costs",
+    ),
+    "weather_vulnerability": "high",
+    "vendor_requirements": (
+        "Weather-resistant equipment suppliers",
+        "Tent/canopy rental services",
+        "Portable facility providers",
+        "Backup power suppliers",
+    ),
+}
+_INDOOR_VENUE_IMPACT = {
+    "setup_requirements": (
+        "Venue decoration within guidelines",
+        "Audio-visual equipment coordination",
+        "Catering coordination with venue",
+    ),
+    "logistics_considerations": (
+        "Venue time restrictions",
+        "Vendor coordination with venue staff",
+        "Parking availability",
+        "Multiple event coordination",
+    ),
+    "cost_implications": (
+        "Venue service charges",
+        "Mandatory vendor restrictions",
+        "Overtime charges for extended events",
+    ),
+    "weather_vulnerability": "low",
+    "vendor_requirements": (),
+}
+_RELIGIOUS_VENUE_IMPACT = {
+    "setup_requirements": (
+        "Religious protocol compliance",
+        "Limited decoration options",
+        "Ceremony timing restrictions",
+        "Sacred space respect",
+    ),
+    "logistics_considerations": (
+        "Religious calendar conflicts",
+        "Dress code requirements",
+        "Photography restrictions",
+        "Ceremony duration limits",
+    ),
+    "cost_implications": (),
+    "weather_vulnerability": "low",
+    "vendor_requirements": (
+        "Religious ceremony specialists",
+        "Culturally appropriate decorators",
+        "Respectful photography services",
+    ),
+}
+_DEFAULT_VENUE_IMPACT_ENTRY = {
+    "setup_requirements": (),
+    "logistics_considerations": (),
+    "cost_implications": (),
+    "weather_vulnerability": "low",
+    "vendor_requirements": (),
+}
+_VENUE_IMPACT_ENTRIES = {
+    VenueType.OUTDOOR: _OUTDOOR_VENUE_IMPACT,
+    VenueType.GARDEN: _OUTDOOR_VENUE_IMPACT,
+    VenueType.BEACH: {
+        **_OUTDOOR_VENUE_IMPACT,
+        "setup_requirements": _OUTDOOR_SETUP + (
+            "Sand-appropriate flooring",
+            "Wind-resistant decorations",
+            "Tide schedule consideration",
+            "Beach access permits",
+        ),
+        "logistics_considerations": _OUTDOOR_LOGISTICS + (
+            "Limited vehicle access",
+            "Sand cleanup requirements",
+            "Tide timing coordination",
+            "Guest footwear considerations",
+        ),
+    },
+    VenueType.HOME: {
+        "setup_requirements": (
+            "Space optimization planning",
+            "Furniture rearrangement",
+            "Neighbor notification",
+            "Parking arrangements",
+        ),
+        "logistics_considerations": (
+            "Limited space for large guest counts",
+            "Noise restrictions",
+            "Limited vendor access",
+            "Cleanup and restoration",
+        ),
+        "cost_implications": (
+            "Potential damage deposits",
+            "Additional cleaning costs",
+            "Rental equipment for space expansion",
+        ),
+        "weather_vulnerability": "low",
+        "vendor_requirements": (),
+    },
+    VenueType.BANQUET_HALL: _INDOOR_VENUE_IMPACT,
+    VenueType.HOTEL: _INDOOR_VENUE_IMPACT,
+    VenueType.TEMPLE: _RELIGIOUS_VENUE_IMPACT,
+    VenueType.CHURCH: _RELIGIOUS_VENUE_IMPACT,
+}
+# Entries laid out as positional tuples in _VENUE_IMPACT_FIELDS order so analysis can
+# unpack them instead of probing each category by name
+_VENUE_IMPACT_FIELDS = (
+    "setup_requirements", "logistics_considerations", "cost_implications",
+    "weather_vulnerability", "vendor_requirements",
+)
+_VENUE_IMPACT = {
+    venue: tuple(entry[field] for field in _VENUE_IMPACT_FIELDS)
+    for venue, entry in _VENUE_IMPACT_ENTRIES.items()
+}
+_DEFAULT_VENUE_IMPACT = tuple(_DEFAULT_VENUE_IMPACT_ENTRY[field] for field in _VENUE_IMPACT_FIELDS)
+
+
+
+def _merge_considerations(base: Dict[str, Tuple[str, ...]],
+                          extras: Dict[str, Tuple[str, ...]]) -> Dict[str, Tuple[str, ...]]:
+    """Append extra entries to the matching categories of a considerations table."""
+    return {category: items + extras.get(category, ()) for category, items in base.items()}
+
+
+# Seasonal planning considerations by season; peak wedding seasons add availability and cost entries
+_NO_SEASONAL_CONSIDERATIONS = {"weather": (), "logistics": (), "costs": (), "availability": ()}
+_SEASONAL_CONSIDERATIONS = {
+    Season.MONSOON: {
+        "weather": (
+            "High probability of rain",
+            "Humidity and heat concerns",
+            "Potential flooding in low-lying areas",
+        ),
+        "logistics": (
+            "Waterproof storage for equipment",
+            "Covered transportation arrangements",
+            "Backup power in case of outages",
+        ),
+        "costs": (
+            "Premium for covered venues",
+            "Additional cost for tenting/covering",
+            "Higher transportation costs",
+        ),
+        "availability": (),
+    },
+    Season.SUMMER: {
+        "weather": (
+            "High temperatures",
+            "Intense sunlight",
+            "Potential heat waves",
+        ),
+        "logistics": (
+            "Cooling arrangements for guests",
+            "Shade structures for outdoor events",
+            "Hydration stations",
+        ),
+        "costs": (
+            "Air conditioning costs",
+            "Cooling equipment rental",
+            "Higher beverage requirements",
+        ),
+        "availability": (),
+    },
+    Season.WINTER: {
+        "weather": (
+            "Cold temperatures",
+            "Potential fog affecting visibility",
+            "Shorter daylight hours",
+        ),
+        "logistics": (
+            "Heating arrangements",
+            "Earlier event timing due to daylight",
+            "Warm clothing considerations for outdoor portions",
+        ),
+        "costs": (),
+        "availability": (),
+    },
+}
+_PEAK_WEDDING_EXTRAS = {
+    "availability": (
+        "High demand for popular venues",
+        "Limited vendor availability",
+        "Need for early booking",
+    ),
+    "costs": (
+        "Peak season pricing premiums",
+        "Higher vendor rates",
+        "Limited negotiation flexibility",
+    ),
+}
+_PEAK_WEDDING_SEASONAL = {
+    season: _merge_considerations(
+        _SEASONAL_CONSIDERATIONS.get(season, _NO_SEASONAL_CONSIDERATIONS), _PEAK_WEDDING_EXTRAS
+    )
+    for season in (Season.WINTER, Season.SPRING)
+}
+
+# Regional considerations for India, with metro city cost and logistics additions
+_NO_REGIONAL_CONSIDERATIONS = {"cultural": (), "logistics": (), "costs": (), "regulations": ()}
+_INDIA_REGIONAL_CONSIDERATIONS = {
+    "cultural": (
+        "Local customs and traditions",
+        "Regional language preferences",
+        "Local festival calendar conflicts",
+    ),
+    "logistics": (
+        "Traffic patterns in major cities",
+        "Local transportation options",
+        "Power backup requirements",
+    ),
+    "costs": (),
+    "regulations": (
+        "Local noise regulations",
+        "Permit requirements for large gatherings",
+        "Fire safety compliance",
+    ),
+}
+_INDIA_METRO_REGIONAL_CONSIDERATIONS = _merge_considerations(_INDIA_REGIONAL_CONSIDERATIONS, {
+    "costs": (
+        "Higher venue costs in metro areas",
+        "Premium vendor pricing",
+        "Parking and transportation premiums",
+    ),
+    "logistics": (
+        "Traffic congestion planning",
+        "Limited parking availability",
+        "Noise restrictions in residential areas",
+    ),
+})
+
+# Seasonal impacts specific to a location, keyed by (lowercase country, season)
+_SEASONAL_LOCATION_IMPACTS = {
+    ("india", Season.MONSOON): (
+        "Monsoon flooding risks in low-lying areas",
+        "Transportation disruptions due to heavy rains",
+        "Higher humidity affecting guest comfort",
+        "Potential power outages during storms",
+    ),
+    ("india", Season.SUMMER): (
+        "Extreme heat in northern regions",
+        "Dust storms in desert areas",
+        "Higher air conditioning costs",
+        "Guest comfort challenges for outdoor events",
+    ),
+    ("india", Season.WINTER): (
+        "Fog affecting transportation in northern regions",
+        "Cold weather considerations for outdoor events",
+        "Peak wedding season pricing",
+        "Higher demand for indoor venues",
+    ),
+}
+
+# Baseline venue accessibility scores (0-10), adjusted when the event has accessibility needs
+_BASE_ACCESSIBILITY_SCORES = {
+    VenueType.BANQUET_HALL: 8.0,
+    VenueType.HOTEL: 9.0,
+    VenueType.COMMUNITY_CENTER: 7.0,
+    VenueType.RESTAURANT: 6.0,
+    VenueType.TEMPLE: 5.0,
+    VenueType.CHURCH: 6.0,
+    VenueType.INDOOR: 7.0,
+    VenueType.HOME: 3.0,
+    VenueType.OUTDOOR: 2.0,
+    VenueType.GARDEN: 3.0,
+    VenueType.BEACH: 1.0,
+    VenueType.HYBRID: 5.0,
+}
+# Venues whose infrastructure helps (boost) or hinders (penalty) accessibility needs
+_ACCESS_BOOST_VENUES = frozenset({VenueType.HOTEL, VenueType.BANQUET_HALL})
+_ACCESS_PENALTY_VENUES = frozenset({VenueType.OUTDOOR, VenueType.BEACH, VenueType.HOME})
+
+# Space requirements per guest (sq ft) by venue type, as (seated, cocktail, dancing)
+_VENUE_SPACE_REQUIREMENTS = {
+    VenueType.BANQUET_HALL: (8, 6, 4),
+    VenueType.RESTAURANT: (12, 8, 6),
+    VenueType.HOTEL: (10, 7, 5),
+    VenueType.OUTDOOR: (15, 10, 8),
+    VenueType.GARDEN: (20, 12, 10),
+    VenueType.BEACH: (25, 15, 12),
+    VenueType.HOME: (6, 4, 3),
+    VenueType.COMMUNITY_CENTER: (8, 6, 4),
+    VenueType.TEMPLE: (5, 4, 3),
+    VenueType.CHURCH: (6, 5, 4),
+    VenueType.HYBRID: (12, 8, 6),
+}
+_DEFAULT_VENUE_SPACE = (10, 7, 5)
+# Estimated floor space per guest (sq ft) for capacity concerns, based on seated layouts
+_SPACE_PER_GUEST_SQFT = {venue: space[0] for venue, space in _VENUE_SPACE_REQUIREMENTS.items()}
+# Venues that struggle with 200+ guests, and venues suited to 1000+ guests
+_SMALL_CAPACITY_VENUES = frozenset({VenueType.RESTAURANT, VenueType.TEMPLE, VenueType.CHURCH})
+_LARGE_EVENT_VENUES = frozenset({VenueType.OUTDOOR, VenueType.BEACH, VenueType.BANQUET_HALL})
+# Space optimization tips for events needing more than 5000 sq ft of seating
+_LARGE_SPACE_OPTIMIZATION_TIPS = (
+    "Consider multiple areas or levels",
+    "Plan staggered seating arrangements",
+    "Use outdoor spaces for cocktail reception",
+    "Implement efficient traffic flow design",
+)
+# Capacity warning rules checked in order, first match wins:
+# (guest threshold, venue group, whether the venue must be in the group, message per venue).
+# Messages are formatted with the venue name up front so warnings need no per-call formatting.
+_CAPACITY_WARNING_RULES = tuple(
+    (threshold, venues, in_venues, {venue: template.format(venue.value) for venue in VenueType})
+    for threshold, venues, in_venues, template in (
+        (500, frozenset({VenueType.HOME}), True,
+         "Home venues typically cannot accommodate 500+ guests comfortably"),
+        (200, _SMALL_CAPACITY_VENUES, True,
+         "{} venues may have capacity limitations for 200+ guests"),
+        (1000, _LARGE_EVENT_VENUES, False,
+         "Very large events (1000+ guests) require specialized large venues"),
+    )
+)
+
+
+def _parse_enum(enum_cls, value):
+    """Look up an enum member by value with a single dict probe.
+    
+    Falls back to the regular constructor for anything the value map does not
+    hold directly (e.g. a member passed in), which also raises the usual ValueError.
+    """
+    try:
+        return enum_cls._value2member_map_[value]
+    except (KeyError, TypeError):
+        return enum_cls(value)
+
+
+def _score_complexity(base_score: float, venue_multiplier: float,
+                      cultural_addition: float, cultural_count: int,
+                      guest_multiplier: float, seasonal_multiplier: float,
+                      duration_days: int, special_count: int, accessibility_count: int,
+                      weather_count: int, budget_multiplier: float) -> float:
+    """
+    Scalar complexity scoring kernel.
+    
+    Takes only plain numbers (table weights already resolved from the enums),
+    so it can be reused by batch and specialized scorers.
+    """
+    score = base_score * venue_multiplier
+    
+    # If multiple cultural requirements, add extra complexity for coordination
+    if cultural_count > 1:
+        cultural_addition *= 1.3
+    score += cultural_addition
+    
+    score *= guest_multiplier
+    score *= seasonal_multiplier
+    
+    # Add complexity for duration
+    if duration_days > 1:
+        score *= 1.0 + (duration_days - 1) * 0.15
+    
+    # Special, accessibility and weather requirements
+    score += special_count * 0.15
+    score += accessibility_count * 0.2
+    score += weather_count * 0.1
+    
+    score *= budget_multiplier
+    
+    # Ensure score is within bounds (conditional expression avoids two builtin calls)
+    return 10.0 if score > 10.0 else (0.0 if score < 0.0 else score)
+
+
+@lru_cache(maxsize=32)
+def _venue_accessibility_score(venue_type: VenueType, has_accessibility_requirements: bool) -> float:
+    """Accessibility score for a venue type, memoized over its small input domain."""
+    score = _BASE_ACCESSIBILITY_SCORES.get(venue_type, 5.0)
+    
+    # Adjust based on accessibility requirements
+    if has_accessibility_requirements:
+        # Venues with better infrastructure can better accommodate accessibility needs
+        if venue_type in _ACCESS_BOOST_VENUES:
+            score += 1.0
+        elif venue_type in _ACCESS_PENALTY_VENUES:
+            score -= 2.0
+    
+    return 10.0 if score > 10.0 else (0.0 if score < 0.0 else score)
+
+
+@lru_cache(maxsize=4096)
+def _venue_capacity_profile(venue_type: VenueType, guest_count: int
+                            ) -> Tuple[Tuple[int, int, int], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Immutable capacity analysis for a venue type and guest count, memoized.
+    
+    Returns ((seated, cocktail, dancing) space in sq ft, capacity warnings, space tips).
+    """
+    seated, cocktail, dancing = _VENUE_SPACE_REQUIREMENTS.get(venue_type, _DEFAULT_VENUE_SPACE)
+    total_space_needed = seated * guest_count
+    
+    # Add the first capacity warning that applies to the guest count and venue type
+    warnings = ()
+    for threshold, venues, in_venues, messages in _CAPACITY_WARNING_RULES:
+        if guest_count > threshold and (venue_type in venues) is in_venues:
+            warnings = (messages[venue_type],)
+            break
+    
+    # Add space optimization tips
+    tips = _LARGE_SPACE_OPTIMIZATION_TIPS if total_space_needed > 5000 else ()
+    
+    return (
+        (total_space_needed, cocktail * guest_count, dancing * guest_count),
+        warnings,
+        tips
+    )
+
+
+def _venue_capacity_constraints(venue_type: VenueType, guest_count: int) -> Dict[str, any]:
+    """Space requirements, capacity warnings and space tips for a venue type and guest count."""
+    (seated_dinner, cocktail_reception, dancing_area), warnings, tips = _venue_capacity_profile(
+        venue_type, guest_count
+    )
+    
+    # Fresh containers per call so callers never mutate the cached profile
+    return {
+        "min_space_required": {
+            "seated_dinner": seated_dinner,
+            "cocktail_reception": cocktail_reception,
+            "dancing_area": dancing_area
+        },
+        "capacity_warnings": list(warnings) if warnings else [],
+        "space_optimization_tips": list(tips) if tips else []
+    }
+
+
 class EventContextAnalyzer:
     """
     Analyzes event context to determine complexity scores and critical factors
@@ -73,6 +690,14 @@ class EventContextAnalyzer:
         Season.AUTUMN: 1.05,  # Generally good but some weather concerns
     }
     
+    # Budget tier adjustments (higher tier = more complexity due to expectations)
+    BUDGET_TIER_MULTIPLIERS = {
+        BudgetTier.LOW: 0.95,
+        BudgetTier.STANDARD: 1.0,
+        BudgetTier.PREMIUM: 1.1,
+        BudgetTier.LUXURY: 1.2,
+    }
+    
     # Guest count complexity scaling
     GUEST_COUNT_THRESHOLDS = [
         (50, 1.0),
@@ -83,6 +708,9 @@ class EventContextAnalyzer:
         (2000, 2.4),
         (float('inf'), 2.8)
     ]
+    # Parallel arrays for bisecting GUEST_COUNT_THRESHOLDS (upper bounds are inclusive)
+    _GUEST_KEYS = tuple(threshold for threshold, _ in GUEST_COUNT_THRESHOLDS[:-1])
+    _GUEST_MULTS = tuple(multiplier for _, multiplier in GUEST_COUNT_THRESHOLDS)
     
     def analyze_context(self, event_params: Dict) -> EventContext:
         """
@@ -95,33 +723,34 @@ class EventContextAnalyzer:
             EventContext with calculated complexity score and analysis
         """
         # Create EventContext from parameters
+        location = event_params['location']
         context = EventContext(
-            event_type=EventType(event_params['event_type']),
+            event_type=_parse_enum(EventType, event_params['event_type']),
             guest_count=event_params['guest_count'],
-            venue_type=VenueType(event_params['venue_type']),
-            cultural_requirements=[CulturalRequirement(req) for req in event_params.get('cultural_requirements', [])],
-            budget_tier=BudgetTier(event_params['budget_tier']),
+            venue_type=_parse_enum(VenueType, event_params['venue_type']),
+            cultural_requirements=[
+                _parse_enum(CulturalRequirement, req) for req in event_params.get('cultural_requirements', ())
+            ],
+            budget_tier=_parse_enum(BudgetTier, event_params['budget_tier']),
             location=Location(
-                city=event_params['location']['city'],
-                state=event_params['location']['state'],
-                country=event_params['location']['country'],
-                timezone=event_params['location']['timezone']
+                city=location['city'],
+                state=location['state'],
+                country=location['country'],
+                timezone=location['timezone']
             ),
-            season=Season(event_params['season']),
+            season=_parse_enum(Season, event_params['season']),
             duration_days=event_params['duration_days'],
             special_requirements=event_params.get('special_requirements', []),
             accessibility_requirements=[
-                AccessibilityRequirement(req) for req in event_params.get('accessibility_requirements', [])
+                _parse_enum(AccessibilityRequirement, req) for req in event_params.get('accessibility_requirements', ())
             ],
             weather_considerations=[
-                WeatherCondition(cond) for cond in event_params.get('weather_considerations', [])
+                _parse_enum(WeatherCondition, cond) for cond in event_params.get('weather_considerations', ())
             ]
         )
         
-        # Calculate complexity score
-        context.complexity_score = self.determine_complexity_score(context)
-        
-        return context
+        # Calculate complexity score (EventContext is frozen, so attach it on a copy)
+        return replace(context, complexity_score=self.determine_complexity_score(context))
     
     def determine_complexity_score(self, context: EventContext) -> float:
         """
@@ -133,64 +762,50 @@ class EventContextAnalyzer:
         Returns:
             Complexity score between 0.0 and 10.0
         """
-        # Start with base complexity for event type
-        base_score = self.EVENT_TYPE_COMPLEXITY.get(context.event_type, 5.0)
-        
-        # Apply venue type multiplier
-        venue_multiplier = self.VENUE_TYPE_MULTIPLIERS.get(context.venue_type, 1.0)
-        score = base_score * venue_multiplier
-        
-        # Add cultural complexity
-        cultural_addition = 0.0
-        for cultural_req in context.cultural_requirements:
-            cultural_addition += self.CULTURAL_COMPLEXITY.get(cultural_req, 1.0)
-        
-        # If multiple cultural requirements, add extra complexity for coordination
-        if len(context.cultural_requirements) > 1:
-            cultural_addition *= 1.3
-        
-        score += cultural_addition
-        
-        # Apply guest count scaling
-        guest_multiplier = self._get_guest_count_multiplier(context.guest_count)
-        score *= guest_multiplier
-        
-        # Apply seasonal adjustments
-        seasonal_multiplier = self.SEASONAL_ADJUSTMENTS.get(context.season, 1.0)
-        score *= seasonal_multiplier
-        
-        # Add complexity for duration
-        if context.duration_days > 1:
-            duration_multiplier = 1.0 + (context.duration_days - 1) * 0.15
-            score *= duration_multiplier
-        
-        # Add complexity for special requirements
-        score += len(context.special_requirements) * 0.15
-        
-        # Add complexity for accessibility requirements
-        score += len(context.accessibility_requirements) * 0.2
-        
-        # Add complexity for weather considerations
-        score += len(context.weather_considerations) * 0.1
-        
-        # Budget tier adjustments (higher tier = more complexity due to expectations)
-        budget_multipliers = {
-            BudgetTier.LOW: 0.95,
-            BudgetTier.STANDARD: 1.0,
-            BudgetTier.PREMIUM: 1.1,
-            BudgetTier.LUXURY: 1.2
-        }
-        score *= budget_multipliers.get(context.budget_tier, 1.0)
+        return self._cached_complexity_score(
+            context.event_type,
+            context.venue_type,
+            tuple(context.cultural_requirements),
+            context.guest_count,
+            context.season,
+            context.duration_days,
+            len(context.special_requirements),
+            len(context.accessibility_requirements),
+            len(context.weather_considerations),
+            context.budget_tier
+        )
+    
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _cached_complexity_score(cls, event_type: EventType, venue_type: VenueType,
+                                 cultural_requirements: Tuple[CulturalRequirement, ...],
+                                 guest_count: int, season: Season, duration_days: int,
+                                 special_count: int, accessibility_count: int,
+                                 weather_count: int, budget_tier: BudgetTier) -> float:
+        """Complexity score memoized on the context fields it depends on."""
+        # Add cultural complexity (C-level iteration; unknown requirements weigh 1.0)
+        cultural_addition = sum(
+            map(cls.CULTURAL_COMPLEXITY.get, cultural_requirements, repeat(1.0)), 0.0
+        )
         
-        # Ensure score is within bounds
-        return min(max(score, 0.0), 10.0)
+        return _score_complexity(
+            base_score=cls.EVENT_TYPE_COMPLEXITY.get(event_type, 5.0),
+            venue_multiplier=cls.VENUE_TYPE_MULTIPLIERS.get(venue_type, 1.0),
+            cultural_addition=cultural_addition,
+            cultural_count=len(cultural_requirements),
+            guest_multiplier=cls._get_guest_count_multiplier(guest_count),
+            seasonal_multiplier=cls.SEASONAL_ADJUSTMENTS.get(season, 1.0),
+            duration_days=duration_days,
+            special_count=special_count,
+            accessibility_count=accessibility_count,
+            weather_count=weather_count,
+            budget_multiplier=cls.BUDGET_TIER_MULTIPLIERS.get(budget_tier, 1.0)
+        )
     
-    def _get_guest_count_multiplier(self, guest_count: int) -> float:
+    @classmethod
+    def _get_guest_count_multiplier(cls, guest_count: int) -> float:
         """Get complexity multiplier based on guest count."""
-        for threshold, multiplier in self.GUEST_COUNT_THRESHOLDS:
-            if guest_count <= threshold:
-                return multiplier
-        return self.GUEST_COUNT_THRESHOLDS[-1][1]
+        return cls._GUEST_MULTS[bisect_left(cls._GUEST_KEYS, guest_count)]
     
     def identify_critical_factors(self, context: EventContext) -> List[CriticalFactor]:
         """
@@ -202,199 +817,69 @@ class EventContextAnalyzer:
         Returns:
             List of CriticalFactor objects ordered by impact level
         """
-        factors = []
+        # Factors are collected into per-priority buckets indexed by Priority.rank
+        # (Critical first, then High, etc.) so the result comes out ordered without a sort
+        buckets = tuple([] for _ in Priority)
+        critical_factors, high_factors = buckets[0], buckets[1]
         
         # Weather-related factors for outdoor venues
-        if context.venue_type in [VenueType.OUTDOOR, VenueType.BEACH, VenueType.GARDEN, VenueType.HYBRID]:
+        if context.venue_type in _WEATHER_EXPOSED_VENUES:
             if context.season == Season.MONSOON:
-                factors.append(CriticalFactor(
-                    name="Monsoon Weather Risk",
-                    impact_level=Priority.CRITICAL,
-                    description="High risk of rain disrupting outdoor activities",
-                    mitigation_strategies=[
-                        "Arrange waterproof tenting",
-                        "Identify indoor backup venue",
-                        "Plan flexible timeline with weather buffers",
-                        "Communicate backup plans to all vendors"
-                    ]
-                ))
+                critical_factors.append(_MONSOON_RISK_FACTOR)
             elif WeatherCondition.RAINY in context.weather_considerations:
-                factors.append(CriticalFactor(
-                    name="Rain Contingency",
-                    impact_level=Priority.HIGH,
-                    description="Potential rain could affect outdoor setup and guest comfort",
-                    mitigation_strategies=[
-                        "Rent covered areas or tents",
-                        "Prepare indoor activity alternatives",
-                        "Ensure proper drainage at venue"
-                    ]
-                ))
+                high_factors.append(_RAIN_CONTINGENCY_FACTOR)
         
         # Large guest count logistics
         if context.guest_count > 500:
-            factors.append(CriticalFactor(
-                name="Large Scale Logistics",
-                impact_level=Priority.CRITICAL,
-                description=f"Managing {context.guest_count} guests requires extensive coordination",
-                mitigation_strategies=[
-                    "Hire professional event coordinator",
-                    "Implement guest flow management system",
-                    "Arrange multiple entry/exit points",
-                    "Plan staggered arrival times",
-                    "Ensure adequate parking and transportation"
-                ]
-            ))
+            critical_factors.append(_large_scale_factor(context.guest_count))
         elif context.guest_count > 200:
-            factors.append(CriticalFactor(
-                name="Medium Scale Coordination",
-                impact_level=Priority.HIGH,
-                description="Significant coordination needed for guest management",
-                mitigation_strategies=[
-                    "Designate area coordinators",
-                    "Plan clear signage and directions",
-                    "Arrange sufficient seating and facilities"
-                ]
-            ))
+            high_factors.append(_MEDIUM_SCALE_FACTOR)
         
         # Cultural ceremony complexity
         if len(context.cultural_requirements) > 1:
-            factors.append(CriticalFactor(
-                name="Multi-Cultural Coordination",
-                impact_level=Priority.HIGH,
-                description="Balancing multiple cultural requirements and traditions",
-                mitigation_strategies=[
-                    "Consult with cultural experts for each tradition",
-                    "Plan separate ceremony spaces if needed",
-                    "Coordinate timing to respect all traditions",
-                    "Ensure dietary requirements are met for all cultures"
-                ]
-            ))
+            high_factors.append(_MULTI_CULTURAL_FACTOR)
         elif CulturalRequirement.HINDU in context.cultural_requirements:
-            factors.append(CriticalFactor(
-                name="Hindu Ceremony Timing",
-                impact_level=Priority.HIGH,
-                description="Hindu ceremonies require specific timing and ritual sequences",
-                mitigation_strategies=[
-                    "Consult with priest for auspicious timing",
-                    "Prepare all ritual items in advance",
-                    "Ensure proper ceremony space setup",
-                    "Plan for extended ceremony duration"
-                ]
-            ))
+            high_factors.append(_HINDU_TIMING_FACTOR)
         
         # Multi-day event complexity
         if context.duration_days > 3:
-            factors.append(CriticalFactor(
-                name="Extended Event Duration",
-                impact_level=Priority.HIGH,
-                description=f"{context.duration_days}-day event requires sustained coordination",
-                mitigation_strategies=[
-                    "Plan daily setup and cleanup schedules",
-                    "Arrange accommodation for out-of-town guests",
-                    "Coordinate vendor schedules across multiple days",
-                    "Plan guest energy management and breaks"
-                ]
-            ))
+            high_factors.append(_extended_duration_factor(context.duration_days))
         
         # Accessibility requirements
         if context.accessibility_requirements:
-            factors.append(CriticalFactor(
-                name="Accessibility Compliance",
-                impact_level=Priority.HIGH,
-                description="Ensuring event is accessible to all guests with special needs",
-                mitigation_strategies=[
-                    "Verify venue accessibility features",
-                    "Arrange specialized transportation if needed",
-                    "Plan accessible seating arrangements",
-                    "Coordinate with accessibility service providers"
-                ]
-            ))
+            high_factors.append(_ACCESSIBILITY_FACTOR)
         
         # Budget tier vs complexity mismatch
         complexity_budget_mismatch = self._check_budget_complexity_mismatch(context)
         if complexity_budget_mismatch:
-            factors.append(complexity_budget_mismatch)
+            buckets[complexity_budget_mismatch.impact_level.rank].append(complexity_budget_mismatch)
         
         # Venue capacity concerns
         venue_capacity_factor = self._check_venue_capacity_concerns(context)
         if venue_capacity_factor:
-            factors.append(venue_capacity_factor)
-        
-        # Sort factors by impact level (Critical first, then High, etc.)
-        priority_order = {
-            Priority.CRITICAL: 0,
-            Priority.HIGH: 1,
-            Priority.MEDIUM: 2,
-            Priority.LOW: 3,
-            Priority.OPTIONAL: 4
-        }
+            buckets[venue_capacity_factor.impact_level.rank].append(venue_capacity_factor)
         
-        factors.sort(key=lambda f: priority_order.get(f.impact_level, 5))
-        
-        return factors
+        return [factor for bucket in buckets for factor in bucket]
     
     def _check_budget_complexity_mismatch(self, context: EventContext) -> CriticalFactor:
         """Check if budget tier matches event complexity."""
         if context.complexity_score > 7.0 and context.budget_tier == BudgetTier.LOW:
-            return CriticalFactor(
-                name="Budget-Complexity Mismatch",
-                impact_level=Priority.HIGH,
-                description="High complexity event with low budget may compromise quality",
-                mitigation_strategies=[
-                    "Prioritize essential elements",
-                    "Consider reducing guest count or duration",
-                    "Explore cost-effective alternatives",
-                    "Focus on high-impact, low-cost elements"
-                ]
-            )
+            return _BUDGET_MISMATCH_FACTOR
         elif context.complexity_score < 3.0 and context.budget_tier == BudgetTier.LUXURY:
-            return CriticalFactor(
-                name="Over-budgeting Risk",
-                impact_level=Priority.MEDIUM,
-                description="Simple event with luxury budget may lead to unnecessary expenses",
-                mitigation_strategies=[
-                    "Focus on premium quality over quantity",
-                    "Invest in memorable experiences",
-                    "Consider upgrading key elements like venue or catering"
-                ]
-            )
+            return _OVER_BUDGET_FACTOR
         return None
     
     def _check_venue_capacity_concerns(self, context: EventContext) -> CriticalFactor:
         """Check for potential venue capacity issues."""
         # Estimate space requirements based on venue type and guest count
-        space_per_guest = {
-            VenueType.BANQUET_HALL: 8,  # sq ft per guest
-            VenueType.RESTAURANT: 12,
-            VenueType.HOTEL: 10,
-            VenueType.OUTDOOR: 15,
-            VenueType.GARDEN: 20,
-            VenueType.BEACH: 25,
-            VenueType.HOME: 6,
-            VenueType.COMMUNITY_CENTER: 8,
-            VenueType.TEMPLE: 5,
-            VenueType.CHURCH: 6,
-            VenueType.HYBRID: 12
-        }
-        
-        required_space = space_per_guest.get(context.venue_type, 10) * context.guest_count
+        required_space = _SPACE_PER_GUEST_SQFT.get(context.venue_type, 10) * context.guest_count
         
         if required_space > 5000:  # Large space requirement
-            return CriticalFactor(
-                name="Venue Capacity Planning",
-                impact_level=Priority.HIGH,
-                description=f"Event requires approximately {required_space} sq ft for {context.guest_count} guests",
-                mitigation_strategies=[
-                    "Verify venue capacity before booking",
-                    "Plan efficient space utilization",
-                    "Consider multiple areas or levels",
-                    "Arrange overflow areas if needed"
-                ]
-            )
+            return _venue_capacity_factor(required_space, context.guest_count)
         
         return None
     
-    def get_seasonal_considerations(self, context: EventContext) -> Dict[str, List[str]]:
+    def get_seasonal_considerations(self, context: EventContext) -> Dict[str, Tuple[str, ...]]:
         """
         Get seasonal considerations that affect planning.
         
@@ -404,76 +889,11 @@ class EventContextAnalyzer:
         Returns:
             Dictionary with seasonal considerations categorized by type
         """
-        considerations = {
-            "weather": [],
-            "logistics": [],
-            "costs": [],
-            "availability": []
-        }
-        
-        if context.season == Season.MONSOON:
-            considerations["weather"].extend([
-                "High probability of rain",
-                "Humidity and heat concerns",
-                "Potential flooding in low-lying areas"
-            ])
-            considerations["logistics"].extend([
-                "Waterproof storage for equipment",
-                "Covered transportation arrangements",
-                "Backup power in case of outages"
-            ])
-            considerations["costs"].extend([
-                "Premium for covered venues",
-                "Additional cost for tenting/covering",
-                "Higher transportation costs"
-            ])
-        
-        elif context.season == Season.SUMMER:
-            considerations["weather"].extend([
-                "High temperatures",
-                "Intense sunlight",
-                "Potential heat waves"
-            ])
-            considerations["logistics"].extend([
-                "Cooling arrangements for guests",
-                "Shade structures for outdoor events",
-                "Hydration stations"
-            ])
-            considerations["costs"].extend([
-                "Air conditioning costs",
-                "Cooling equipment rental",
-                "Higher beverage requirements"
-            ])
-        
-        elif context.season == Season.WINTER:
-            considerations["weather"].extend([
-                "Cold temperatures",
-                "Potential fog affecting visibility",
-                "Shorter daylight hours"
-            ])
-            considerations["logistics"].extend([
-                "Heating arrangements",
-                "Earlier event timing due to daylight",
-                "Warm clothing considerations for outdoor portions"
-            ])
-        
-        # Peak season availability and cost considerations
-        peak_seasons = [Season.WINTER, Season.SPRING]  # Wedding peak seasons
-        if context.season in peak_seasons and context.event_type == EventType.WEDDING:
-            considerations["availability"].extend([
-                "High demand for popular venues",
-                "Limited vendor availability",
-                "Need for early booking"
-            ])
-            considerations["costs"].extend([
-                "Peak season pricing premiums",
-                "Higher vendor rates",
-                "Limited negotiation flexibility"
-            ])
-        
-        return considerations
+        if context.event_type == EventType.WEDDING and context.season in _PEAK_WEDDING_SEASONAL:
+            return dict(_PEAK_WEDDING_SEASONAL[context.season])
+        return dict(_SEASONAL_CONSIDERATIONS.get(context.season, _NO_SEASONAL_CONSIDERATIONS))
     
-    def get_regional_considerations(self, context: EventContext) -> Dict[str, List[str]]:
+    def get_regional_considerations(self, context: EventContext) -> Dict[str, Tuple[str, ...]]:
         """
         Get regional considerations based on location.
         
@@ -483,46 +903,12 @@ class EventContextAnalyzer:
         Returns:
             Dictionary with regional considerations
         """
-        considerations = {
-            "cultural": [],
-            "logistics": [],
-            "costs": [],
-            "regulations": []
-        }
-        
-        # India-specific considerations
-        if context.location.country.lower() == "india":
-            considerations["cultural"].extend([
-                "Local customs and traditions",
-                "Regional language preferences",
-                "Local festival calendar conflicts"
-            ])
-            considerations["logistics"].extend([
-                "Traffic patterns in major cities",
-                "Local transportation options",
-                "Power backup requirements"
-            ])
-            considerations["regulations"].extend([
-                "Local noise regulations",
-                "Permit requirements for large gatherings",
-                "Fire safety compliance"
-            ])
-            
-            # Metro city specific considerations
-            metro_cities = ["mumbai", "delhi", "bangalore", "chennai", "kolkata", "hyderabad", "pune"]
-            if context.location.city.lower() in metro_cities:
-                considerations["costs"].extend([
-                    "Higher venue costs in metro areas",
-                    "Premium vendor pricing",
-                    "Parking and transportation premiums"
-                ])
-                considerations["logistics"].extend([
-                    "Traffic congestion planning",
-                    "Limited parking availability",
-                    "Noise restrictions in residential areas"
-                ])
-        
-        return considerations
+        # India-specific considerations, with metro city additions
+        if context.location.country_key != "india":
+            return dict(_NO_REGIONAL_CONSIDERATIONS)
+        if context.location.city_key in _REGIONAL_METRO_CITIES:
+            return dict(_INDIA_METRO_REGIONAL_CONSIDERATIONS)
+        return dict(_INDIA_REGIONAL_CONSIDERATIONS)
     
     def analyze_venue_impact(self, context: EventContext) -> Dict[str, any]:
         """
@@ -534,124 +920,24 @@ class EventContextAnalyzer:
         Returns:
             Dictionary with venue impact analysis
         """
-        venue_analysis = {
-            "complexity_multiplier": self.VENUE_TYPE_MULTIPLIERS.get(context.venue_type, 1.0),
-            "setup_requirements": [],
-            "logistics_considerations": [],
-            "cost_implications": [],
-            "weather_vulnerability": "low",
-            "accessibility_score": 0.0,
-            "capacity_constraints": {},
-            "vendor_requirements": []
-        }
-        
-        # Venue-specific analysis
-        if context.venue_type in [VenueType.OUTDOOR, VenueType.BEACH, VenueType.GARDEN]:
-            venue_analysis["weather_vulnerability"] = "high"
-            venue_analysis["setup_requirements"].extend([
-                "Weather protection (tents/canopies)",
-                "Ground covering/flooring",
-                "Portable facilities (restrooms, power)",
-                "Lighting arrangements",
-                "Sound system with weather protection"
-            ])
-            venue_analysis["logistics_considerations"].extend([
-                "Weather contingency planning",
-                "Extended setup/breakdown time",
-                "Equipment transportation challenges",
-                "Guest comfort in outdoor conditions"
-            ])
-            venue_analysis["cost_implications"].extend([
-                "Additional rental costs for weather protection",
-                "Higher insurance requirements",
-                "Extended vendor time for setup",
-                "Backup venue costs"
-            ])
-            venue_analysis["vendor_requirements"].extend([
-                "Weather-resistant equipment suppliers",
-                "Tent/canopy rental services",
-                "Portable facility providers",
-                "Backup power suppliers"
-            ])
-            
-        if context.venue_type == VenueType.BEACH:
-            venue_analysis["setup_requirements"].extend([
-                "Sand-appropriate flooring",
-                "Wind-resistant decorations",
-                "Tide schedule consideration",
-                "Beach access permits"
-            ])
-            venue_analysis["logistics_considerations"].extend([
-                "Limited vehicle access",
-                "Sand cleanup requirements",
-                "Tide timing coordination",
-                "Guest footwear considerations"
-            ])
-            
-        elif context.venue_type == VenueType.HOME:
-            venue_analysis["setup_requirements"].extend([
-                "Space optimization planning",
-                "Furniture rearrangement",
-                "Neighbor notification",
-                "Parking arrangements"
-            ])
-            venue_analysis["logistics_considerations"].extend([
-                "Limited space for large guest counts",
-                "Noise restrictions",
-                "Limited vendor access",
-                "Cleanup and restoration"
-            ])
-            venue_analysis["cost_implications"].extend([
-                "Potential damage deposits",
-                "Additional cleaning costs",
-                "Rental equipment for space expansion"
-            ])
-            
-        elif context.venue_type in [VenueType.BANQUET_HALL, VenueType.HOTEL]:
-            venue_analysis["weather_vulnerability"] = "low"
-            venue_analysis["setup_requirements"].extend([
-                "Venue decoration within guidelines",
-                "Audio-visual equipment coordination",
-                "Catering coordination with venue"
-            ])
-            venue_analysis["logistics_considerations"].extend([
-                "Venue time restrictions",
-                "Vendor coordination with venue staff",
-                "Parking availability",
-                "Multiple event coordination"
-            ])
-            venue_analysis["cost_implications"].extend([
-                "Venue service charges",
-                "Mandatory vendor restrictions",
-                "Overtime charges for extended events"
-            ])
-            
-        elif context.venue_type in [VenueType.TEMPLE, VenueType.CHURCH]:
-            venue_analysis["setup_requirements"].extend([
-                "Religious protocol compliance",
-                "Limited decoration options",
-                "Ceremony timing restrictions",
-                "Sacred space respect"
-            ])
-            venue_analysis["logistics_considerations"].extend([
-                "Religious calendar conflicts",
-                "Dress code requirements",
-                "Photography restrictions",
-                "Ceremony duration limits"
-            ])
-            venue_analysis["vendor_requirements"].extend([
-                "Religious ceremony specialists",
-                "Culturally appropriate decorators",
-                "Respectful photography services"
-            ])
-        
-        # Calculate accessibility score
-        venue_analysis["accessibility_score"] = self._calculate_venue_accessibility_score(context)
-        
-        # Determine capacity constraints
-        venue_analysis["capacity_constraints"] = self._analyze_venue_capacity_constraints(context)
+        # Venue-derived fields are computed together from the venue type read once
+        venue_type = context.venue_type
+        setup, logistics, costs, weather_vulnerability, vendors = _VENUE_IMPACT.get(
+            venue_type, _DEFAULT_VENUE_IMPACT
+        )
         
-        return venue_analysis
+        return {
+            "complexity_multiplier": self.VENUE_TYPE_MULTIPLIERS.get(venue_type, 1.0),
+            "setup_requirements": setup,
+            "logistics_considerations": logistics,
+            "cost_implications": costs,
+            "weather_vulnerability": weather_vulnerability,
+            "accessibility_score": _venue_accessibility_score(
+                venue_type, bool(context.accessibility_requirements)
+            ),
+            "capacity_constraints": _venue_capacity_constraints(venue_type, context.guest_count),
+            "vendor_requirements": vendors
+        }
     
     def analyze_location_impact(self, context: EventContext) -> Dict[str, any]:
         """
@@ -675,8 +961,10 @@ class EventContextAnalyzer:
             "infrastructure_quality": "standard"
         }
         
+        location = context.location
+        
         # Country-specific analysis
-        if context.location.country.lower() == "india":
+        if location.country_key == "india":
             location_analysis["cultural_factors"].extend([
                 "Local customs and traditions",
                 "Regional language preferences",
@@ -691,8 +979,8 @@ class EventContextAnalyzer:
             ])
             
             # Metro city analysis
-            metro_cities = ["mumbai", "delhi", "bangalore", "chennai", "kolkata", "hyderabad", "pune", "ahmedabad"]
-            if context.location.city.lower() in metro_cities:
+            city = location.city_key
+            if city in _METRO_CITIES:
                 location_analysis["cost_multiplier"] = 1.3
                 location_analysis["vendor_availability"] = "high"
                 location_analysis["logistics_complexity"] = "high"
@@ -710,7 +998,7 @@ class EventContextAnalyzer:
                 location_analysis["infrastructure_quality"] = "high"
                 
             # Tier-2 city analysis
-            elif context.location.city.lower() in ["jaipur", "lucknow", "kanpur", "nagpur", "indore", "bhopal", "visakhapatnam", "patna"]:
+            elif city in _TIER2_CITIES:
                 location_analysis["cost_multiplier"] = 1.1
                 location_analysis["vendor_availability"] = "medium"
                 location_analysis["logistics_complexity"] = "medium"
@@ -735,109 +1023,13 @@ class EventContextAnalyzer:
     
     def _calculate_venue_accessibility_score(self, context: EventContext) -> float:
         """Calculate accessibility score for venue type."""
-        base_scores = {
-            VenueType.BANQUET_HALL: 8.0,
-            VenueType.HOTEL: 9.0,
-            VenueType.COMMUNITY_CENTER: 7.0,
-            VenueType.RESTAURANT: 6.0,
-            VenueType.TEMPLE: 5.0,
-            VenueType.CHURCH: 6.0,
-            VenueType.INDOOR: 7.0,
-            VenueType.HOME: 3.0,
-            VenueType.OUTDOOR: 2.0,
-            VenueType.GARDEN: 3.0,
-            VenueType.BEACH: 1.0,
-            VenueType.HYBRID: 5.0
-        }
-        
-        score = base_scores.get(context.venue_type, 5.0)
-        
-        # Adjust based on accessibility requirements
-        if context.accessibility_requirements:
-            # Venues with better infrastructure can better accommodate accessibility needs
-            if context.venue_type in [VenueType.HOTEL, VenueType.BANQUET_HALL]:
-                score += 1.0
-            elif context.venue_type in [VenueType.OUTDOOR, VenueType.BEACH, VenueType.HOME]:
-                score -= 2.0
-        
-        return min(max(score, 0.0), 10.0)
+        return _venue_accessibility_score(context.venue_type, bool(context.accessibility_requirements))
     
     def _analyze_venue_capacity_constraints(self, context: EventContext) -> Dict[str, any]:
         """Analyze capacity constraints for venue type."""
-        # Space requirements per guest (in sq ft)
-        space_requirements = {
-            VenueType.BANQUET_HALL: {"seated": 8, "cocktail": 6, "dancing": 4},
-            VenueType.RESTAURANT: {"seated": 12, "cocktail": 8, "dancing": 6},
-            VenueType.HOTEL: {"seated": 10, "cocktail": 7, "dancing": 5},
-            VenueType.OUTDOOR: {"seated": 15, "cocktail": 10, "dancing": 8},
-            VenueType.GARDEN: {"seated": 20, "cocktail": 12, "dancing": 10},
-            VenueType.BEACH: {"seated": 25, "cocktail": 15, "dancing": 12},
-            VenueType.HOME: {"seated": 6, "cocktail": 4, "dancing": 3},
-            VenueType.COMMUNITY_CENTER: {"seated": 8, "cocktail": 6, "dancing": 4},
-            VenueType.TEMPLE: {"seated": 5, "cocktail": 4, "dancing": 3},
-            VenueType.CHURCH: {"seated": 6, "cocktail": 5, "dancing": 4},
-            VenueType.HYBRID: {"seated": 12, "cocktail": 8, "dancing": 6}
-        }
-        
-        venue_space = space_requirements.get(context.venue_type, {"seated": 10, "cocktail": 7, "dancing": 5})
-        
-        constraints = {
-            "min_space_required": {
-                "seated_dinner": venue_space["seated"] * context.guest_count,
-                "cocktail_reception": venue_space["cocktail"] * context.guest_count,
-                "dancing_area": venue_space["dancing"] * context.guest_count
-            },
-            "capacity_warnings": [],
-            "space_optimization_tips": []
-        }
-        
-        total_space_needed = constraints["min_space_required"]["seated_dinner"]
-        
-        # Add capacity warnings based on guest count and venue type
-        if context.guest_count > 500 and context.venue_type == VenueType.HOME:
-            constraints["capacity_warnings"].append("Home venues typically cannot accommodate 500+ guests comfortably")
-        elif context.guest_count > 200 and context.venue_type in [VenueType.RESTAURANT, VenueType.TEMPLE, VenueType.CHURCH]:
-            constraints["capacity_warnings"].append(f"{context.venue_type.value} venues may have capacity limitations for 200+ guests")
-        elif context.guest_count > 1000 and context.venue_type not in [VenueType.OUTDOOR, VenueType.BEACH, VenueType.BANQUET_HALL]:
-            constraints["capacity_warnings"].append("Very large events (1000+ guests) require specialized large venues")
-        
-        # Add space optimization tips
-        if total_space_needed > 5000:
-            constraints["space_optimization_tips"].extend([
-                "Consider multiple areas or levels",
-                "Plan staggered seating arrangements",
-                "Use outdoor spaces for cocktail reception",
-                "Implement efficient traffic flow design"
-            ])
-        
-        return constraints
+        return _venue_capacity_constraints(context.venue_type, context.guest_count)
     
     def _get_seasonal_location_impacts(self, context: EventContext) -> List[str]:
         """Get seasonal impacts specific to location."""
-        impacts = []
-        
-        # India-specific seasonal impacts
-        if context.location.country.lower() == "india":
-            if context.season == Season.MONSOON:
-                impacts.extend([
-                    "Monsoon flooding risks in low-lying areas",
-                    "Transportation disruptions due to heavy rains",
-                    "Higher humidity affecting guest comfort",
-                    "Potential power outages during storms"
-                ])
-            elif context.season == Season.SUMMER:
-                impacts.extend([
-                    "Extreme heat in northern regions",
-                    "Dust storms in desert areas",
-                    "Higher air conditioning costs",
-                    "Guest comfort challenges for outdoor events"
-                ])
-            elif context.season == Season.WINTER:
-                impacts.extend([
-                    "Fog affecting transportation in northern regions",
-                    "Cold weather considerations for outdoor events",
-                    "Peak wedding season pricing",
-                    "Higher demand for indoor venues"
-                ])
-        
-        return impacts
\ No newline at end of file
+        impacts = _SEASONAL_LOCATION_IMPACTS.get((context.location.country_key, context.season))
+        return list(impacts) if impacts else []
@@ -1,11 +1,16 @@
-from typing import Dict, List, Optional, Any
+from typing import AsyncIterator, Dict, List, Optional, Any
 from app.utils.supabase_client import SupabaseClient
 from app.services.timeline_generator import generate_timeline, generate_deep_dive_for_day
 from app.services.vendor_search import search_vendors
-from app.services.budget_calculator import calculate_budget, calculate_detailed_budget
+from app.services.budget_calculator import calculate_budget, calculate_detailed_budget, adjust_budget_for_modifications
 from app.utils.helpers import days_between
 from datetime import datetime
+from bisect import bisect_left, bisect_right
+from copy import deepcopy
+from functools import lru_cache
+import asyncio
 import logging
+import time
 
 # Import new intelligence engines
 try:
@@ -22,6 +27,360 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Complexity score bands: below 3 is low, below 6 medium, below 8 high, otherwise very high
+_COMPLEXITY_BOUNDS = (3, 6, 8)
+_COMPLEXITY_LEVELS = ("low", "medium", "high", "very_high")
+
+# Guest count categories: up to 50 is intimate, up to 150 medium, up to 300 large
+_GUEST_COUNT_BOUNDS = (50, 150, 300)
+_GUEST_COUNT_CATEGORIES = ("intimate", "medium", "large", "very_large")
+
+# Coordination complexity by (lowercase) venue type; unlisted venues are "medium"
+_VENUE_COMPLEXITY = {
+    "outdoor": "high",
+    "beach": "very_high",
+    "garden": "high",
+    "home": "medium",
+    "hybrid": "high",
+    "indoor": "low",
+    "banquet_hall": "low",
+    "hotel": "low",
+    "restaurant": "low",
+}
+
+# Static budget optimization suggestion bundles
+_LOW_TIER_SUGGESTIONS = (
+    "Consider DIY decorations to reduce decoration costs",
+    "Opt for buffet-style catering instead of plated service",
+    "Use family/friends for coordination to reduce vendor costs",
+    "Choose off-peak dates for better vendor rates",
+)
+_PREMIUM_TIER_SUGGESTIONS = (
+    "Invest in premium photography for lasting memories",
+    "Consider luxury transportation for VIP guests",
+    "Upgrade to premium venue with inclusive services",
+    "Add signature experiences like live cooking stations",
+)
+_OUTDOOR_VENUE_SUGGESTIONS = (
+    "Allocate 15-20% extra budget for weather contingencies",
+    "Consider tent rental for weather protection",
+    "Budget for additional power and lighting requirements",
+)
+_HOME_VENUE_SUGGESTIONS = (
+    "Reduce venue costs but increase decoration budget",
+    "Consider furniture rental for additional seating",
+    "Budget for professional cleaning services",
+)
+_LARGE_GUEST_COUNT_SUGGESTIONS = (
+    "Consider multiple smaller venues instead of one large venue",
+    "Implement staggered arrival times to manage crowd flow",
+    "Budget for professional crowd management services",
+)
+_SMALL_GUEST_COUNT_SUGGESTIONS = (
+    "Focus budget on premium experiences rather than scale",
+    "Consider intimate venue options for better per-person value",
+    "Invest in personalized touches and premium services",
+)
+
+# Recommendations for each timeline approach and budget scenario
+_APPROACH_RECOMMENDATIONS = {
+    "fast": (
+        "Book vendors who offer express services",
+        "Choose venues with built-in amenities",
+        "Prepare detailed timeline with all stakeholders",
+    ),
+    "premium": (
+        "Invest in professional event coordination",
+        "Book premium vendors well in advance",
+        "Consider guest experience at every touchpoint",
+    ),
+    "budget": (
+        "Prioritize essential elements over nice-to-haves",
+        "Leverage family and friends for support",
+        "Focus on meaningful experiences over expensive items",
+    ),
+    "balanced": (
+        "Balance cost and quality across all categories",
+        "Allocate budget based on event priorities",
+        "Maintain flexibility for adjustments",
+    ),
+}
+_SCENARIO_RECOMMENDATIONS = {
+    "budget_conscious": (
+        "Focus spending on high-impact elements",
+        "Consider off-peak timing for better rates",
+        "Leverage personal networks for cost savings",
+    ),
+    "premium": (
+        "Book premium vendors well in advance",
+        "Consider package deals for better value",
+        "Invest in professional coordination",
+    ),
+    "emergency": (
+        "Be flexible with vendor and venue options",
+        "Expect to pay premium for short notice",
+        "Focus on essential elements first",
+    ),
+    "standard": (
+        "Balance quality and cost across categories",
+        "Plan 3-6 months in advance for best options",
+        "Keep 10-15% contingency for unexpected costs",
+    ),
+}
+
+# Factors listed for a budget category, formatted with the event's guest_count,
+# venue_type and event_type
+_CATEGORY_FACTOR_TEMPLATES = {
+    "venue": (
+        "Guest count: {guest_count} people",
+        "Venue type: {venue_type}",
+        "Event type: {event_type}",
+    ),
+    "catering": (
+        "Per-person catering for {guest_count} guests",
+        "Event type dietary requirements: {event_type}",
+        "Regional food preferences considered",
+    ),
+    "decoration": (
+        "Venue decoration requirements: {venue_type}",
+        "Event theme: {event_type}",
+        "Seasonal decoration availability",
+    ),
+    "entertainment": (
+        "Entertainment suitable for {guest_count} guests",
+        "Event type entertainment: {event_type}",
+        "Cultural preferences considered",
+    ),
+    "photography": (
+        "Coverage for {guest_count} guests",
+        "Event duration and complexity",
+        "Professional documentation requirements",
+    ),
+}
+
+# Timeline reasoning texts shared by every event
+_ACTIVITY_DEPENDENCIES = (
+    "Venue setup must complete before guest arrival",
+    "Photography setup depends on decoration completion",
+    "Catering service depends on guest count confirmation",
+    "Entertainment setup requires sound system installation",
+)
+_CRITICAL_PATH = (
+    "Venue booking and confirmation",
+    "Catering arrangements and menu finalization",
+    "Guest invitation and RSVP management",
+    "Vendor coordination and timeline synchronization",
+    "Day-of event coordination and execution",
+)
+_BASE_CONTINGENCY_PLANS = (
+    "Backup vendor contacts for critical services",
+    "Weather contingency for outdoor elements",
+    "Timeline flexibility for unexpected delays",
+)
+_OUTDOOR_CONTINGENCY_PLANS = (
+    "Indoor backup venue arrangement",
+    "Weather monitoring and decision protocols",
+)
+
+# Learning impact messages for low (<= 2), neutral and high (>= 4) satisfaction ratings
+_FEEDBACK_LEARNING_MESSAGES = (
+    "Feedback will help identify areas for improvement in future recommendations",
+    "Feedback will contribute to pattern refinement and optimization",
+    "Positive feedback will reinforce successful patterns for similar events",
+)
+
+# Recommendations appended after the event-specific ones for every set of alternatives
+_GENERAL_ALTERNATIVE_RECOMMENDATIONS = (
+    "Review trade-offs carefully before selecting alternatives",
+    "Consider hybrid approaches combining elements from different alternatives",
+    "Consult with vendors about feasibility of timeline changes",
+)
+
+# Alternatives offered for every event; handed out as deep copies since they are nested
+_TIMELINE_ALTERNATIVES = (
+    # Fast-track alternative
+    {
+        "name": "Fast-Track Timeline",
+        "description": "Compressed timeline with parallel activities",
+        "timeline_changes": [
+            "Combine setup activities to save 2 hours",
+            "Parallel vendor coordination",
+            "Streamlined ceremony sequences"
+        ],
+        "cost_impact": -500.0,
+        "time_savings": "4-6 hours total",
+        "trade_offs": [
+            "Less buffer time for delays",
+            "Higher coordination complexity",
+            "Potential stress on vendors"
+        ]
+    },
+    # Premium alternative
+    {
+        "name": "Premium Experience Timeline",
+        "description": "Extended timeline with luxury touches",
+        "timeline_changes": [
+            "Extended preparation time for premium setup",
+            "Additional entertainment segments",
+            "Professional coordination throughout"
+        ],
+        "cost_impact": 2000.0,
+        "time_savings": None,
+        "trade_offs": [
+            "Higher budget requirements",
+            "Longer event duration",
+            "Premium vendor requirements"
+        ]
+    },
+)
+_BUDGET_ALTERNATIVES = (
+    # Budget-conscious alternative
+    {
+        "name": "Budget-Conscious Allocation",
+        "description": "Cost-optimized budget distribution",
+        "category_changes": {
+            "venue": -1000.0,
+            "catering": -1500.0,
+            "decoration": -500.0,
+            "entertainment": -300.0
+        },
+        "total_budget_change": -3300.0,
+        "impact_analysis": [
+            "Simpler venue options",
+            "Buffet-style catering",
+            "DIY decoration elements",
+            "Playlist instead of live entertainment"
+        ]
+    },
+    # Premium alternative
+    {
+        "name": "Premium Experience Allocation",
+        "description": "Luxury-focused budget distribution",
+        "category_changes": {
+            "venue": 2000.0,
+            "catering": 3000.0,
+            "entertainment": 1500.0,
+            "photography": 1000.0
+        },
+        "total_budget_change": 7500.0,
+        "impact_analysis": [
+            "Premium venue with full services",
+            "Multi-course plated dining",
+            "Live entertainment and performances",
+            "Professional photography and videography"
+        ]
+    },
+)
+
+# Upper bound on analyzed contexts kept by EventService._context_from_event, which are
+# shared by every request the service handles
+_CONTEXT_CACHE_SIZE = 256
+
+# Owned-event lookups are reused for a few seconds, which covers the burst of requests a
+# client makes when it opens an event; entry lifetime in seconds and maximum events kept
+_EVENT_CACHE_TTL = 2
+_EVENT_CACHE_SIZE = 1024
+
+# Timeline days fetched per query when streaming an event's timeline
+_TIMELINE_STREAM_PAGE_SIZE = 7
+
+# Deep dives fetched at once by get_timeline_reasoning; an uncached day makes an LLM call
+# in a worker thread, so this bounds both thread pool use and provider request rate
+_DEEP_DIVE_CONCURRENCY = 4
+
+# In-process deep dive cache: entry lifetime in seconds and maximum number of days kept
+_DEEP_DIVE_CACHE_TTL = 300
+_DEEP_DIVE_CACHE_SIZE = 1024
+
+# Accepted event_type values, in declaration order for the validation message
+_EVENT_TYPE_VALUES = tuple(e.value for e in EventType) if ENHANCED_ENGINES_AVAILABLE else (
+    'wedding', 'birthday', 'anniversary', 'housewarming', 'corporate',
+    'graduation', 'baby_shower', 'engagement', 'festival', 'conference'
+)
+VALID_EVENT_TYPES = frozenset(_EVENT_TYPE_VALUES)
+_INVALID_EVENT_TYPE_MESSAGE = (
+    f"Input validation failed: Invalid event_type: must be one of {list(_EVENT_TYPE_VALUES)}"
+)
+
+# Lookup tables used to build an EventContext from stored event fields
+if ENHANCED_ENGINES_AVAILABLE:
+    _RELIGION_TO_CULTURAL_REQUIREMENT = {
+        "hindu": CulturalRequirement.HINDU,
+        "hinduism": CulturalRequirement.HINDU,
+        "muslim": CulturalRequirement.MUSLIM,
+        "islam": CulturalRequirement.MUSLIM,
+        "christian": CulturalRequirement.CHRISTIAN,
+        "christianity": CulturalRequirement.CHRISTIAN,
+        "sikh": CulturalRequirement.SIKH,
+        "sikhism": CulturalRequirement.SIKH,
+    }
+
+    # Per-person budget tiers: below 2000 is low, below 5000 standard, below 12000 premium
+    _PER_PERSON_BUDGET_BOUNDS = (2000, 5000, 12000)
+    _PER_PERSON_BUDGET_TIERS = (BudgetTier.LOW, BudgetTier.STANDARD, BudgetTier.PREMIUM, BudgetTier.LUXURY)
+
+    # Base budget estimation: per-person rates by event type and venue multipliers, kept as
+    # Decimals so the estimate is computed exactly rather than via float
+    _BASE_RATES_PER_PERSON = {
+        EventType.WEDDING: Decimal(8000),
+        EventType.BIRTHDAY: Decimal(1500),
+        EventType.CORPORATE: Decimal(3000),
+        EventType.ANNIVERSARY: Decimal(4000),
+        EventType.ENGAGEMENT: Decimal(3500),
+        EventType.HOUSEWARMING: Decimal(2000),
+    }
+    _DEFAULT_BASE_RATE_PER_PERSON = Decimal(2000)
+    _VENUE_BUDGET_MULTIPLIERS = {
+        VenueType.OUTDOOR: Decimal("1.3"),
+        VenueType.HOTEL: Decimal("1.4"),
+        VenueType.BANQUET_HALL: Decimal("1.1"),
+        VenueType.HOME: Decimal("0.7"),
+        VenueType.INDOOR: Decimal("1.0"),
+    }
+    _DEFAULT_VENUE_BUDGET_MULTIPLIER = Decimal("1.0")
+    _EXTRA_DAY_BUDGET_FACTOR = Decimal("0.6")
+    _HIGH_COMPLEXITY_BUDGET_MULTIPLIER = Decimal("1.3")
+    _MEDIUM_COMPLEXITY_BUDGET_MULTIPLIER = Decimal("1.15")
+
+    # Season of the current month, indexed by month number (index 0 is unused)
+    _MONTH_TO_SEASON = (
+        None,
+        Season.WINTER, Season.WINTER, Season.SPRING, Season.SPRING, Season.SPRING, Season.SUMMER,
+        Season.SUMMER, Season.SUMMER, Season.AUTUMN, Season.AUTUMN, Season.AUTUMN, Season.WINTER,
+    )
+
+
+@lru_cache(maxsize=64)
+def _parse_event_type(event_type: str) -> "EventType":
+    """Parse a stored event_type, falling back to a birthday for unknown values"""
+    try:
+        return EventType(event_type.lower())
+    except ValueError:
+        return EventType.BIRTHDAY
+
+
+@lru_cache(maxsize=256)
+def _parse_location(location: str) -> "Location":
+    """Parse a stored "City, State" string; the state defaults to Maharashtra"""
+    location_parts = location.split(',')
+    return Location(
+        city=location_parts[0].strip(),
+        state=location_parts[1].strip() if len(location_parts) > 1 else "Maharashtra",
+        country="India",
+        timezone="Asia/Kolkata"
+    )
+
+
+@lru_cache(maxsize=64)
+def _parse_venue_type(venue_type: Optional[str]) -> "VenueType":
+    """Parse a stored venue_type such as "Banquet Hall", falling back to indoor"""
+    if venue_type:
+        try:
+            return VenueType(venue_type.lower().replace(' ', '_'))
+        except ValueError:
+            pass
+    return VenueType.INDOOR
+
 class EventService:
     def __init__(self):
         self.supabase = SupabaseClient()
@@ -36,6 +395,18 @@ class EventService:
             self.budget_engine = None
             self.context_analyzer = None
 
+        # Feedback is only fed to pattern learning once a learning system is wired in
+        self._pattern_learning_enabled = False
+
+        # Events keyed by (event_id, user_id) -> (expires_at, event)
+        self._event_cache: Dict[tuple, tuple] = {}
+
+        # Stored deep dives keyed by (event_id, day_number) -> (expires_at, deep_dive)
+        self._deep_dive_cache: Dict[tuple, tuple] = {}
+
+        # Analyzed contexts of stored events, keyed by the fields they are built from
+        self._context_cache: Dict[tuple, Any] = {}
+
     async def create_event(self, user_id: str, event_data: Dict) -> Dict:
         """Create a complete event with enhanced timeline and budget intelligence"""
         
@@ -43,13 +414,8 @@ class EventService:
         event_type = event_data["event_type"]
         
         # Validate event type
-        valid_event_types = [e.value for e in EventType] if ENHANCED_ENGINES_AVAILABLE else [
-            'wedding', 'birthday', 'anniversary', 'housewarming', 'corporate', 
-            'graduation', 'baby_shower', 'engagement', 'festival', 'conference'
-        ]
-        
-        if event_type not in valid_event_types:
-            raise Exception(f"Input validation failed: Invalid event_type: must be one of {valid_event_types}")
+        if event_type not in VALID_EVENT_TYPES:
+            raise Exception(_INVALID_EVENT_TYPE_MESSAGE)
         
         start_date = event_data["start_date"]
         end_date = event_data.get("end_date")
@@ -71,6 +437,7 @@ class EventService:
             days_count = 1
         
         # Create enhanced event context if engines are available
+        context = None
         if ENHANCED_ENGINES_AVAILABLE and self.context_analyzer:
             try:
                 context = self._create_enhanced_context(
@@ -121,85 +488,105 @@ class EventService:
                 religion=religion
             )
 
-        # Create event record with enhanced data
-        event_record = self.supabase.create_event(user_id, {
-            "event_type": event_type,
-            "start_date": start_date,
-            "end_date": end_date,
-            "location": location,
-            "budget": budget,
-            "religion": religion,
-            "estimated_budget": estimated_budget,
-            "guest_count": guest_count,
-            "venue_type": venue_type,
-            "special_requirements": special_requirements,
-            "accessibility_requirements": accessibility_requirements,
-            "weather_considerations": weather_considerations
-        })
+        # Timeline generation and vendor search don't depend on the event record, so run
+        # all three in worker threads at once. Threads can't be cancelled, so every call
+        # is waited for and failures are re-raised only once all of them have finished.
+        event_record, timeline, vendors_raw = await asyncio.gather(
+            asyncio.to_thread(self.supabase.create_event, user_id, {
+                "event_type": event_type,
+                "start_date": start_date,
+                "end_date": end_date,
+                "location": location,
+                "budget": budget,
+                "religion": religion,
+                "estimated_budget": estimated_budget,
+                "guest_count": guest_count,
+                "venue_type": venue_type,
+                "special_requirements": special_requirements,
+                "accessibility_requirements": accessibility_requirements,
+                "weather_considerations": weather_considerations
+            }),
+            asyncio.to_thread(
+                generate_timeline,
+                event_type=event_type,
+                start_date=start_date,
+                end_date=end_date,
+                religion=religion,
+                budget=budget,
+                guest_count=guest_count,
+                venue_type=venue_type,
+                location=location,
+                special_requirements=special_requirements,
+                accessibility_requirements=accessibility_requirements,
+                weather_considerations=weather_considerations
+            ),
+            asyncio.to_thread(search_vendors, event_type, location),
+            return_exceptions=True
+        )
 
+        if isinstance(event_record, BaseException):
+            raise event_record
         if not event_record:
             raise Exception("Failed to create event")
 
         event_id = event_record["id"]
 
-        # Generate enhanced timeline with contextual parameters
-        timeline = generate_timeline(
-            event_type=event_type,
-            start_date=start_date,
-            end_date=end_date,
-            religion=religion,
-            budget=budget,
-            guest_count=guest_count,
-            venue_type=venue_type,
-            location=location,
-            special_requirements=special_requirements,
-            accessibility_requirements=accessibility_requirements,
-            weather_considerations=weather_considerations
-        )
+        for result in (timeline, vendors_raw):
+            if isinstance(result, BaseException):
+                # The event row is already committed; don't leave it without a timeline
+                await asyncio.to_thread(self.supabase.delete_event, event_id, user_id)
+                raise result
 
         # Save timeline days to database with enhanced formatting
-        event_days = []
-        for day_data in timeline:
-            event_days.append({
-                "event_id": event_id,
-                "day_number": day_data["day"],
-                "date": day_data["date"],
-                "summary": day_data["summary"],
-                "estimated_cost": day_data.get("estimated_cost"),
-                "details": day_data.get("details", []),
-                "notes": day_data.get("notes", []),
-                "contingency_plans": day_data.get("contingency_plans", [])
-            })
-
-        self.supabase.create_event_days(event_days)
-
-        # Search and save vendors
-        vendors_raw = search_vendors(event_type, location)
+        event_days = [{
+            "event_id": event_id,
+            "day_number": day_data["day"],
+            "date": day_data["date"],
+            "summary": day_data["summary"],
+            "estimated_cost": day_data.get("estimated_cost"),
+            "details": day_data.get("details", []),
+            "notes": day_data.get("notes", []),
+            "contingency_plans": day_data.get("contingency_plans", [])
+        } for day_data in timeline]
+
+        # Save vendors, building the slim response entries in the same pass
         vendors = []
+        response_vendors = []
         if vendors_raw:
+            search_query = f"{event_type} vendors near {location}"
             for vendor in vendors_raw:
+                title = vendor.get("title", "")
+                url = vendor.get("url")
+                snippet = vendor.get("snippet", "")
                 vendors.append({
                     "event_id": event_id,
-                    "title": vendor.get("title", ""),
-                    "url": vendor.get("url"),
-                    "snippet": vendor.get("snippet", ""),
-                    "search_query": f"{event_type} vendors near {location}",
+                    "title": title,
+                    "url": url,
+                    "snippet": snippet,
+                    "search_query": search_query,
                     "source": "tavily"
                 })
-            
-            self.supabase.create_vendors(vendors)
+                response_vendors.append({"title": title, "url": url, "snippet": snippet})
+
+        # Timeline days and vendors are written together in a single round-trip. The event
+        # row is already committed, so remove it again rather than leave it without them.
+        try:
+            await asyncio.to_thread(self.supabase.create_event_children, event_days, vendors)
+        except Exception:
+            await asyncio.to_thread(self.supabase.delete_event, event_id, user_id)
+            raise
 
         # Create enhanced response with additional context
         response = {
             "event_id": event_id,
             "timeline": timeline,
-            "vendors": [{"title": v["title"], "url": v["url"], "snippet": v["snippet"]} for v in vendors],
+            "vendors": response_vendors,
             "estimated_budget": estimated_budget,
             "event_details": event_record
         }
         
         # Add enhanced context information if available
-        if ENHANCED_ENGINES_AVAILABLE and 'context' in locals():
+        if context is not None:
             response["context_analysis"] = {
                 "complexity_score": context.complexity_score,
                 "critical_factors": [factor.name for factor in self.context_analyzer.identify_critical_factors(context)[:3]],
@@ -211,20 +598,16 @@ class EventService:
 
     async def get_event_timeline(self, event_id: int, user_id: str) -> Dict:
         """Get event timeline from database"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
-            raise Exception("Event not found or access denied")
-
-        # Get event details
-        event = self.supabase.get_event(event_id, user_id)
+        # Fetch the event, its days and its vendors concurrently. The event lookup
+        # doubles as the ownership check; the days and vendors are discarded unless
+        # it succeeds.
+        event, days, vendors = await asyncio.gather(
+            self._get_owned_event(event_id, user_id),
+            asyncio.to_thread(self.supabase.get_event_days, event_id),
+            asyncio.to_thread(self.supabase.get_event_vendors, event_id)
+        )
         if not event:
-            raise Exception("Event not found")
-
-        # Get timeline days
-        days = self.supabase.get_event_days(event_id)
-        
-        # Get vendors
-        vendors = self.supabase.get_event_vendors(event_id)
+            raise Exception("Event not found or access denied")
 
         return {
             "event_id": event_id,
@@ -234,32 +617,78 @@ class EventService:
             "estimated_budget": event["estimated_budget"]
         }
 
+    async def stream_event_timeline(self, event_id: int, user_id: str) -> AsyncIterator[Dict]:
+        """Yield the event header, then each timeline day as its page of days is fetched"""
+        # The first page of days is fetched alongside the ownership check and discarded
+        # unless it succeeds, as in get_event_timeline
+        event, vendors, days = await asyncio.gather(
+            self._get_owned_event(event_id, user_id),
+            asyncio.to_thread(self.supabase.get_event_vendors, event_id),
+            asyncio.to_thread(self.supabase.get_event_days, event_id, 0, _TIMELINE_STREAM_PAGE_SIZE)
+        )
+        if not event:
+            raise Exception("Event not found or access denied")
+
+        yield {
+            "event_id": event_id,
+            "event_details": event,
+            "vendors": [{"title": v["title"], "url": v["url"], "snippet": v["snippet"]} for v in vendors],
+            "estimated_budget": event["estimated_budget"]
+        }
+
+        offset = 0
+        while days:
+            for day in days:
+                yield day
+            if len(days) < _TIMELINE_STREAM_PAGE_SIZE:
+                break
+            offset += _TIMELINE_STREAM_PAGE_SIZE
+            days = await asyncio.to_thread(
+                self.supabase.get_event_days, event_id, offset, _TIMELINE_STREAM_PAGE_SIZE
+            )
+
     async def get_deep_dive(self, event_id: int, day_number: int, user_id: str) -> Dict:
         """Get or generate deep dive for a specific day"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
-            raise Exception("Event not found or access denied")
+        # Serve recently seen deep dives without going back to the database
+        cache_key = (event_id, day_number)
+        deep_dive = self._get_cached_deep_dive(cache_key)
+        if deep_dive is not None:
+            # The cache is shared between users, so ownership is still checked
+            if await self._get_owned_event(event_id, user_id) is None:
+                raise Exception("Event not found or access denied")
+            return {
+                "event_id": event_id,
+                "day_number": day_number,
+                "deep_dive": deep_dive
+            }
 
-        # Get event and day data
-        event = self.supabase.get_event(event_id, user_id)
-        day_data = self.supabase.get_event_day(event_id, day_number)
-        
-        if not event or not day_data:
+        # Get event and day data; None when the user doesn't own it
+        event, day_data = await asyncio.gather(
+            self._get_owned_event(event_id, user_id),
+            asyncio.to_thread(self.supabase.get_event_day, event_id, day_number)
+        )
+        if not event:
+            raise Exception("Event not found or access denied")
+        if not day_data:
             raise Exception("Event or day not found")
 
         # Check if deep dive already exists
         if day_data.get("deep_dive_data"):
+            self._cache_deep_dive(cache_key, day_data["deep_dive_data"])
             return {
                 "event_id": event_id,
                 "day_number": day_number,
                 "deep_dive": day_data["deep_dive_data"]
             }
 
-        # Generate new enhanced deep dive with contextual parameters
-        deep_dive = generate_deep_dive_for_day(
+        # Generate new enhanced deep dive with contextual parameters; generation is
+        # blocking, so it runs in a worker thread to keep the event loop responsive
+        start_date = event["start_date"]
+        deep_dive = await asyncio.to_thread(
+            generate_deep_dive_for_day,
             event_type=event["event_type"],
-            start_date=event["start_date"],
-            end_date=event["end_date"] or event["start_date"],
+            start_date=start_date,
+            end_date=event["end_date"] or start_date,
             religion=event.get("religion"),
             day_number=day_number,
             budget=event.get("budget"),
@@ -269,7 +698,8 @@ class EventService:
         )
 
         # Cache the deep dive
-        self.supabase.update_event_day_deep_dive(event_id, day_number, deep_dive)
+        await asyncio.to_thread(self.supabase.update_event_day_deep_dive, event_id, day_number, deep_dive)
+        self._cache_deep_dive(cache_key, deep_dive)
 
         return {
             "event_id": event_id,
@@ -277,32 +707,74 @@ class EventService:
             "deep_dive": deep_dive
         }
 
+    async def _get_owned_event(self, event_id: int, user_id: str) -> Optional[Dict[str, Any]]:
+        """Get the user's event, or None when it doesn't exist or belongs to another user"""
+        key = (event_id, user_id)
+        entry = self._event_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        # get_event only matches the user's own events, so one query covers ownership too
+        event = await asyncio.to_thread(self.supabase.get_event, event_id, user_id)
+        if event is not None:
+            self._event_cache.pop(key, None)
+            if len(self._event_cache) >= _EVENT_CACHE_SIZE:
+                self._event_cache.pop(next(iter(self._event_cache)))
+            self._event_cache[key] = (time.monotonic() + _EVENT_CACHE_TTL, event)
+        return event
+
+    def _get_cached_deep_dive(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached deep dive that has not expired yet, or None"""
+        entry = self._deep_dive_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, deep_dive = entry
+        if expires_at <= time.monotonic():
+            del self._deep_dive_cache[key]
+            return None
+        return deep_dive
+
+    def _cache_deep_dive(self, key: tuple, deep_dive: Dict[str, Any]) -> None:
+        """Store a deep dive, replacing any previous entry for the same day"""
+        self._deep_dive_cache.pop(key, None)
+        if len(self._deep_dive_cache) >= _DEEP_DIVE_CACHE_SIZE:
+            self._deep_dive_cache.pop(next(iter(self._deep_dive_cache)))
+        self._deep_dive_cache[key] = (time.monotonic() + _DEEP_DIVE_CACHE_TTL, deep_dive)
+
     async def get_user_events(self, user_id: str) -> List[Dict]:
         """Get all events for a user"""
-        return self.supabase.get_user_events(user_id)
+        return await asyncio.to_thread(self.supabase.get_user_events, user_id)
 
     async def get_detailed_budget(self, event_id: int, user_id: str) -> Dict:
         """Get enhanced detailed budget breakdown for an event"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
+        # Get event details; None when the user doesn't own it
+        event = await self._get_owned_event(event_id, user_id)
+        if not event:
             raise Exception("Event not found or access denied")
 
-        # Get event details
-        event = self.supabase.get_event(event_id, user_id)
-        if not event:
-            raise Exception("Event not found")
+        return {
+            "event_id": event_id,
+            "event_details": event,
+            "detailed_budget": self._compute_detailed_budget(event, event_id)
+        }
 
+    def _compute_detailed_budget(self, event: Dict[str, Any], event_id: int) -> Dict[str, Any]:
+        """Calculate the detailed budget breakdown for an already fetched and verified event"""
         # Calculate days
+        end_date = event.get("end_date")
         try:
-            days_count = days_between(event["start_date"], event.get("end_date")) if event.get("end_date") else 1
+            days_count = days_between(event["start_date"], end_date) if end_date else 1
         except:
             days_count = 1
 
+        # Events created without a budget store NULL there, so fall through to the estimate
+        total_budget = float(event.get("budget") or event.get("estimated_budget") or 10000)
+
         # Get enhanced detailed budget breakdown
         detailed_budget = calculate_detailed_budget(
             event_type=event["event_type"],
             days=days_count,
-            total_budget=float(event.get("budget", event.get("estimated_budget", 10000))),
+            total_budget=total_budget,
             guest_count=event.get("guest_count"),
             venue_type=event.get("venue_type"),
             location=event.get("location"),
@@ -316,17 +788,10 @@ class EventService:
         if ENHANCED_ENGINES_AVAILABLE and self.budget_engine and self.context_analyzer:
             try:
                 # Create context for enhanced analysis
-                context = self._create_enhanced_context(
-                    event_type=event["event_type"],
-                    guest_count=event.get("guest_count", 100),
-                    venue_type=event.get("venue_type", "indoor"),
-                    location=event.get("location", "Mumbai"),
-                    religion=event.get("religion"),
-                    budget=float(event.get("budget", event.get("estimated_budget", 10000))),
-                    days_count=days_count,
-                    special_requirements=event.get("special_requirements", []),
-                    accessibility_requirements=event.get("accessibility_requirements", []),
-                    weather_considerations=event.get("weather_considerations", [])
+                context = self._context_from_event(
+                    event,
+                    budget=total_budget,
+                    days_count=days_count
                 )
                 
                 # Add enhanced analysis
@@ -343,20 +808,14 @@ class EventService:
             except Exception as e:
                 logger.warning(f"Enhanced budget analysis failed: {str(e)}")
 
-        return {
-            "event_id": event_id,
-            "event_details": event,
-            "detailed_budget": detailed_budget
-        }
+        return detailed_budget
 
     def _analyze_complexity_impact(self, context: EventContext) -> Dict[str, Any]:
         """Analyze how complexity affects budget allocation"""
         
         complexity_analysis = {
             "score": context.complexity_score,
-            "level": "low" if context.complexity_score < 3 else 
-                    "medium" if context.complexity_score < 6 else
-                    "high" if context.complexity_score < 8 else "very_high",
+            "level": _COMPLEXITY_LEVELS[bisect_right(_COMPLEXITY_BOUNDS, context.complexity_score)],
             "factors": [],
             "budget_implications": []
         }
@@ -388,47 +847,21 @@ class EventService:
         
         # Budget tier specific suggestions
         if context.budget_tier == BudgetTier.LOW:
-            suggestions.extend([
-                "Consider DIY decorations to reduce decoration costs",
-                "Opt for buffet-style catering instead of plated service",
-                "Use family/friends for coordination to reduce vendor costs",
-                "Choose off-peak dates for better vendor rates"
-            ])
+            suggestions.extend(_LOW_TIER_SUGGESTIONS)
         elif context.budget_tier == BudgetTier.PREMIUM:
-            suggestions.extend([
-                "Invest in premium photography for lasting memories",
-                "Consider luxury transportation for VIP guests",
-                "Upgrade to premium venue with inclusive services",
-                "Add signature experiences like live cooking stations"
-            ])
+            suggestions.extend(_PREMIUM_TIER_SUGGESTIONS)
         
         # Venue specific suggestions
         if context.venue_type == VenueType.OUTDOOR:
-            suggestions.extend([
-                "Allocate 15-20% extra budget for weather contingencies",
-                "Consider tent rental for weather protection",
-                "Budget for additional power and lighting requirements"
-            ])
+            suggestions.extend(_OUTDOOR_VENUE_SUGGESTIONS)
         elif context.venue_type == VenueType.HOME:
-            suggestions.extend([
-                "Reduce venue costs but increase decoration budget",
-                "Consider furniture rental for additional seating",
-                "Budget for professional cleaning services"
-            ])
+            suggestions.extend(_HOME_VENUE_SUGGESTIONS)
         
         # Guest count specific suggestions
         if context.guest_count > 300:
-            suggestions.extend([
-                "Consider multiple smaller venues instead of one large venue",
-                "Implement staggered arrival times to manage crowd flow",
-                "Budget for professional crowd management services"
-            ])
+            suggestions.extend(_LARGE_GUEST_COUNT_SUGGESTIONS)
         elif context.guest_count < 50:
-            suggestions.extend([
-                "Focus budget on premium experiences rather than scale",
-                "Consider intimate venue options for better per-person value",
-                "Invest in personalized touches and premium services"
-            ])
+            suggestions.extend(_SMALL_GUEST_COUNT_SUGGESTIONS)
         
         return suggestions[:6]  # Limit to top 6 suggestions
 
@@ -436,18 +869,13 @@ class EventService:
 
     async def get_budget_explanation(self, event_id: int, user_id: str) -> Dict[str, Any]:
         """Get detailed explanation of budget allocation decisions"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
-            raise Exception("Event not found or access denied")
-
-        # Get event details
-        event = self.supabase.get_event(event_id, user_id)
+        # Get event details; None when the user doesn't own it
+        event = await self._get_owned_event(event_id, user_id)
         if not event:
-            raise Exception("Event not found")
+            raise Exception("Event not found or access denied")
 
-        # Get detailed budget
-        budget_result = await self.get_detailed_budget(event_id, user_id)
-        detailed_budget = budget_result["detailed_budget"]
+        # Get detailed budget for the event fetched above
+        detailed_budget = self._compute_detailed_budget(event, event_id)
 
         # Create explanation response
         categories_explanation = []
@@ -481,23 +909,35 @@ class EventService:
 
     async def get_timeline_reasoning(self, event_id: int, user_id: str) -> Dict[str, Any]:
         """Get detailed reasoning behind timeline activity sequencing"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
+        # Get event and timeline data; None when the user doesn't own it
+        event, timeline_days = await asyncio.gather(
+            self._get_owned_event(event_id, user_id),
+            asyncio.to_thread(self.supabase.get_event_days, event_id)
+        )
+        if not event:
             raise Exception("Event not found or access denied")
-
-        # Get event and timeline data
-        event = self.supabase.get_event(event_id, user_id)
-        timeline_days = self.supabase.get_event_days(event_id)
-        
-        if not event or not timeline_days:
+        if not timeline_days:
             raise Exception("Event or timeline not found")
 
+        # Get deep dives for detailed activity information; the days are independent,
+        # so fetch (or generate) a few of them at a time
+        semaphore = asyncio.Semaphore(_DEEP_DIVE_CONCURRENCY)
+
+        async def get_day_deep_dive(day_number: int) -> Dict:
+            async with semaphore:
+                return await self.get_deep_dive(event_id, day_number, user_id)
+
+        deep_dives = await asyncio.gather(
+            *(get_day_deep_dive(day["day_number"]) for day in timeline_days),
+            return_exceptions=True
+        )
+
         # Create timeline explanations
         timeline_explanations = []
-        for day in timeline_days:
-            # Get deep dive for detailed activity information
+        for day, deep_dive in zip(timeline_days, deep_dives):
             try:
-                deep_dive = await self.get_deep_dive(event_id, day["day_number"], user_id)
+                if isinstance(deep_dive, BaseException):
+                    raise deep_dive
                 deep_dive_data = deep_dive.get("deep_dive", {})
                 
                 activities = []
@@ -548,14 +988,10 @@ class EventService:
 
     async def get_alternatives(self, event_id: int, user_id: str) -> Dict[str, Any]:
         """Get alternative timeline and budget options"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
-            raise Exception("Event not found or access denied")
-
-        # Get event details
-        event = self.supabase.get_event(event_id, user_id)
+        # Get event details; None when the user doesn't own it
+        event = await self._get_owned_event(event_id, user_id)
         if not event:
-            raise Exception("Event not found")
+            raise Exception("Event not found or access denied")
 
         # Generate timeline alternatives
         timeline_alternatives = self._generate_timeline_alternatives(event)
@@ -575,17 +1011,15 @@ class EventService:
 
     async def modify_budget_allocation(self, event_id: int, user_id: str, modification_data: Dict[str, Any]) -> Dict[str, Any]:
         """Modify budget allocation and get impact analysis"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
+        # Get event details; None when the user doesn't own it
+        event = await self._get_owned_event(event_id, user_id)
+        if not event:
             raise Exception("Event not found or access denied")
 
         # Get current budget allocation
-        budget_result = await self.get_detailed_budget(event_id, user_id)
-        current_allocation = budget_result["detailed_budget"]
+        current_allocation = self._compute_detailed_budget(event, event_id)
 
         # Apply modifications using budget calculator
-        from app.services.budget_calculator import adjust_budget_for_modifications
-        
         try:
             updated_allocation = adjust_budget_for_modifications(
                 current_allocation, 
@@ -612,7 +1046,7 @@ class EventService:
     async def submit_feedback(self, event_id: int, user_id: str, feedback_data: Dict[str, Any]) -> Dict[str, Any]:
         """Submit user feedback for pattern learning"""
         # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
+        if await self._get_owned_event(event_id, user_id) is None:
             raise Exception("Event not found or access denied")
 
         try:
@@ -631,11 +1065,11 @@ class EventService:
             }
             
             # Save to database (assuming supabase has a feedback table)
-            feedback_id = self.supabase.create_feedback(feedback_record)
+            feedback_id = await asyncio.to_thread(self.supabase.create_feedback, feedback_record)
             
             # Process feedback for pattern learning if enhanced engines are available
             learning_impact = "Feedback recorded for future improvements"
-            if ENHANCED_ENGINES_AVAILABLE and hasattr(self, 'pattern_learning_system'):
+            if ENHANCED_ENGINES_AVAILABLE and self._pattern_learning_enabled:
                 try:
                     # Process feedback through pattern learning system
                     learning_impact = self._process_feedback_for_learning(event_id, feedback_data)
@@ -654,14 +1088,10 @@ class EventService:
 
     async def get_timeline_alternatives(self, event_id: int, user_id: str, approach: str) -> Dict[str, Any]:
         """Generate alternative timeline approaches"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
-            raise Exception("Event not found or access denied")
-
-        # Get event details
-        event = self.supabase.get_event(event_id, user_id)
+        # Get event details; None when the user doesn't own it
+        event = await self._get_owned_event(event_id, user_id)
         if not event:
-            raise Exception("Event not found")
+            raise Exception("Event not found or access denied")
 
         # Generate alternatives based on approach
         alternatives = self._generate_approach_based_alternatives(event, approach)
@@ -675,14 +1105,10 @@ class EventService:
 
     async def get_budget_alternatives(self, event_id: int, user_id: str, scenario: str) -> Dict[str, Any]:
         """Generate alternative budget allocation scenarios"""
-        # Verify ownership
-        if not self.supabase.verify_user_owns_event(event_id, user_id):
-            raise Exception("Event not found or access denied")
-
-        # Get event details
-        event = self.supabase.get_event(event_id, user_id)
+        # Get event details; None when the user doesn't own it
+        event = await self._get_owned_event(event_id, user_id)
         if not event:
-            raise Exception("Event not found")
+            raise Exception("Event not found or access denied")
 
         # Generate budget scenarios
         scenarios = self._generate_budget_scenarios(event, scenario)
@@ -701,70 +1127,47 @@ class EventService:
                                 weather_considerations: List[str]) -> EventContext:
         """Create enhanced EventContext from event parameters"""
         
-        # Parse event type
-        try:
-            event_type_enum = EventType(event_type.lower())
-        except ValueError:
-            event_type_enum = EventType.BIRTHDAY  # Default fallback
-        
-        # Parse venue type
-        venue_type_enum = VenueType.INDOOR  # Default
-        if venue_type:
-            try:
-                venue_type_enum = VenueType(venue_type.lower().replace(' ', '_'))
-            except ValueError:
-                pass
+        # Parse event and venue types (memoized, unknown values fall back to defaults)
+        event_type_enum = _parse_event_type(event_type)
+        venue_type_enum = _parse_venue_type(venue_type)
         
         # Parse cultural requirements
-        cultural_requirements = []
-        if religion:
-            religion_normalized = religion.strip().lower()
-            if religion_normalized in ["hindu", "hinduism"]:
-                cultural_requirements.append(CulturalRequirement.HINDU)
-            elif religion_normalized in ["muslim", "islam"]:
-                cultural_requirements.append(CulturalRequirement.MUSLIM)
-            elif religion_normalized in ["christian", "christianity"]:
-                cultural_requirements.append(CulturalRequirement.CHRISTIAN)
-            elif religion_normalized in ["sikh", "sikhism"]:
-                cultural_requirements.append(CulturalRequirement.SIKH)
+        cultural_requirement = _RELIGION_TO_CULTURAL_REQUIREMENT.get(religion.strip().lower()) if religion else None
+        cultural_requirements = [cultural_requirement] if cultural_requirement else []
         
-        # Create location object
-        location_parts = location.split(',') if isinstance(location, str) else [str(location)]
-        location_obj = Location(
-            city=location_parts[0].strip() if location_parts else "Mumbai",
-            state=location_parts[1].strip() if len(location_parts) > 1 else "Maharashtra",
-            country="India",
-            timezone="Asia/Kolkata"
-        )
+        # Create location object (memoized; Location is immutable so it can be shared)
+        location_obj = _parse_location(location if isinstance(location, str) else str(location))
         
         # Determine budget tier
         budget_tier = BudgetTier.STANDARD  # Default
         if budget and guest_count:
-            per_person_budget = budget / guest_count
-            if per_person_budget < 2000:
-                budget_tier = BudgetTier.LOW
-            elif per_person_budget < 5000:
-                budget_tier = BudgetTier.STANDARD
-            elif per_person_budget < 12000:
-                budget_tier = BudgetTier.PREMIUM
-            else:
-                budget_tier = BudgetTier.LUXURY
+            budget_tier = _PER_PERSON_BUDGET_TIERS[bisect_right(_PER_PERSON_BUDGET_BOUNDS, budget / guest_count)]
         
         # Determine season based on current date
-        current_month = datetime.now().month
-        if current_month in [12, 1, 2]:
-            season = Season.WINTER
-        elif current_month in [3, 4, 5]:
-            season = Season.SPRING
-        elif current_month in [6, 7, 8]:
-            season = Season.SUMMER
-        elif current_month in [9, 10, 11]:
-            season = Season.AUTUMN
-        else:
-            season = Season.SPRING  # Default
+        season = _MONTH_TO_SEASON[datetime.now().month]
+        
+        # The context analyzer builds the EventContext itself from plain event parameters
+        # and attaches its complexity score
+        if self.context_analyzer:
+            return self.context_analyzer.analyze_context({
+                "event_type": event_type_enum.value,
+                "guest_count": guest_count,
+                "venue_type": venue_type_enum.value,
+                "cultural_requirements": [requirement.value for requirement in cultural_requirements],
+                "budget_tier": budget_tier.value,
+                "location": {
+                    "city": location_obj.city,
+                    "state": location_obj.state,
+                    "country": location_obj.country,
+                    "timezone": location_obj.timezone
+                },
+                "season": season.value,
+                "duration_days": days_count,
+                "special_requirements": list(special_requirements or ())
+            })
         
         # Create EventContext object
-        context = EventContext(
+        return EventContext(
             event_type=event_type_enum,
             guest_count=guest_count,
             venue_type=venue_type_enum,
@@ -778,124 +1181,97 @@ class EventService:
             weather_considerations=[],  # Convert strings to enums if needed
             complexity_score=0.0
         )
-        
-        # Use context analyzer to analyze and enhance context
-        if self.context_analyzer:
-            context = self.context_analyzer.analyze_context(context)
-        
+
+    def _context_from_event(self, event: Dict[str, Any], budget: float, days_count: int) -> EventContext:
+        """Get the analyzed EventContext for a stored event.
+
+        Contexts are cached on the service for the life of the process and shared by all
+        requests, since they depend only on the event fields in the key.
+        """
+        event_type = event["event_type"]
+        guest_count = event.get("guest_count", 100)
+        venue_type = event.get("venue_type", "indoor")
+        location = event.get("location", "Mumbai")
+        religion = event.get("religion")
+        special_requirements = event.get("special_requirements", [])
+        # The season is derived from the current month, so it is part of the key
+        key = (
+            event_type, guest_count, venue_type, location, religion, budget, days_count,
+            tuple(special_requirements or ()), datetime.now().month
+        )
+        try:
+            context = self._context_cache.get(key)
+        except TypeError:
+            # Unhashable requirement entries; build without caching
+            key, context = None, None
+
+        if context is None:
+            context = self._create_enhanced_context(
+                event_type=event_type,
+                guest_count=guest_count,
+                venue_type=venue_type,
+                location=location,
+                religion=religion,
+                budget=budget,
+                days_count=days_count,
+                special_requirements=special_requirements,
+                accessibility_requirements=event.get("accessibility_requirements", []),
+                weather_considerations=event.get("weather_considerations", [])
+            )
+            if key is not None:
+                if len(self._context_cache) >= _CONTEXT_CACHE_SIZE:
+                    self._context_cache.pop(next(iter(self._context_cache)))
+                self._context_cache[key] = context
+
         return context
 
     def _estimate_base_budget(self, context: EventContext) -> Decimal:
         """Estimate base budget based on event context"""
         
-        # Base budget rates per person by event type
-        base_rates = {
-            EventType.WEDDING: 8000,
-            EventType.BIRTHDAY: 1500,
-            EventType.CORPORATE: 3000,
-            EventType.ANNIVERSARY: 4000,
-            EventType.ENGAGEMENT: 3500,
-            EventType.HOUSEWARMING: 2000
-        }
-        
-        base_rate = base_rates.get(context.event_type, 2000)
-        
         # Adjust for guest count
-        base_budget = base_rate * context.guest_count
+        base_budget = _BASE_RATES_PER_PERSON.get(context.event_type, _DEFAULT_BASE_RATE_PER_PERSON) * context.guest_count
         
         # Adjust for duration
         if context.duration_days > 1:
-            base_budget *= (1 + (context.duration_days - 1) * 0.6)
+            base_budget *= 1 + (context.duration_days - 1) * _EXTRA_DAY_BUDGET_FACTOR
         
         # Adjust for venue type
-        venue_multipliers = {
-            VenueType.OUTDOOR: 1.3,
-            VenueType.HOTEL: 1.4,
-            VenueType.BANQUET_HALL: 1.1,
-            VenueType.HOME: 0.7,
-            VenueType.INDOOR: 1.0
-        }
-        
-        multiplier = venue_multipliers.get(context.venue_type, 1.0)
-        base_budget *= multiplier
+        base_budget *= _VENUE_BUDGET_MULTIPLIERS.get(context.venue_type, _DEFAULT_VENUE_BUDGET_MULTIPLIER)
         
         # Adjust for complexity
         if context.complexity_score > 7:
-            base_budget *= 1.3
+            base_budget *= _HIGH_COMPLEXITY_BUDGET_MULTIPLIER
         elif context.complexity_score > 5:
-            base_budget *= 1.15
+            base_budget *= _MEDIUM_COMPLEXITY_BUDGET_MULTIPLIER
         
-        return Decimal(str(base_budget))
+        return base_budget
 
     def _categorize_guest_count(self, guest_count: int) -> str:
         """Categorize guest count for context analysis"""
-        if guest_count <= 50:
-            return "intimate"
-        elif guest_count <= 150:
-            return "medium"
-        elif guest_count <= 300:
-            return "large"
-        else:
-            return "very_large"
+        return _GUEST_COUNT_CATEGORIES[bisect_left(_GUEST_COUNT_BOUNDS, guest_count)]
 
     def _get_venue_complexity(self, venue_type: str) -> str:
         """Get venue complexity level"""
-        complexity_map = {
-            "outdoor": "high",
-            "beach": "very_high",
-            "garden": "high",
-            "home": "medium",
-            "hybrid": "high",
-            "indoor": "low",
-            "banquet_hall": "low",
-            "hotel": "low",
-            "restaurant": "low"
-        }
-        
-        return complexity_map.get(venue_type.lower(), "medium")
+        # Stored venue types are normally lowercase already; only normalize when needed
+        if not venue_type.islower():
+            venue_type = venue_type.lower()
+        return _VENUE_COMPLEXITY.get(venue_type, "medium")
 
     # Helper methods for new API endpoints
 
     def _get_category_factors(self, category: str, event: Dict[str, Any]) -> List[str]:
         """Get factors considered for budget category allocation"""
-        factors = []
+        templates = _CATEGORY_FACTOR_TEMPLATES.get(category)
+        if not templates:
+            return []
         
         guest_count = event.get("guest_count", 100)
         venue_type = event.get("venue_type", "indoor")
         event_type = event.get("event_type", "birthday")
-        
-        if category == "venue":
-            factors.extend([
-                f"Guest count: {guest_count} people",
-                f"Venue type: {venue_type}",
-                f"Event type: {event_type}"
-            ])
-        elif category == "catering":
-            factors.extend([
-                f"Per-person catering for {guest_count} guests",
-                f"Event type dietary requirements: {event_type}",
-                "Regional food preferences considered"
-            ])
-        elif category == "decoration":
-            factors.extend([
-                f"Venue decoration requirements: {venue_type}",
-                f"Event theme: {event_type}",
-                "Seasonal decoration availability"
-            ])
-        elif category == "entertainment":
-            factors.extend([
-                f"Entertainment suitable for {guest_count} guests",
-                f"Event type entertainment: {event_type}",
-                "Cultural preferences considered"
-            ])
-        elif category == "photography":
-            factors.extend([
-                f"Coverage for {guest_count} guests",
-                f"Event duration and complexity",
-                "Professional documentation requirements"
-            ])
-        
-        return factors
+        return [
+            template.format(guest_count=guest_count, venue_type=venue_type, event_type=event_type)
+            for template in templates
+        ]
 
     def _get_timeline_reasoning(self, day: Dict[str, Any], event: Dict[str, Any]) -> List[str]:
         """Get reasoning for timeline day structure"""
@@ -928,13 +1304,7 @@ class EventService:
 
     def _get_activity_dependencies(self, day: Dict[str, Any]) -> List[str]:
         """Get activity dependencies for the day"""
-        dependencies = [
-            "Venue setup must complete before guest arrival",
-            "Photography setup depends on decoration completion",
-            "Catering service depends on guest count confirmation",
-            "Entertainment setup requires sound system installation"
-        ]
-        return dependencies
+        return list(_ACTIVITY_DEPENDENCIES)
 
     def _get_buffer_time_explanation(self, event: Dict[str, Any]) -> str:
         """Get explanation for buffer time allocation"""
@@ -962,141 +1332,40 @@ class EventService:
 
     def _get_critical_path_explanation(self, event: Dict[str, Any]) -> List[str]:
         """Get critical path activities explanation"""
-        return [
-            "Venue booking and confirmation",
-            "Catering arrangements and menu finalization",
-            "Guest invitation and RSVP management",
-            "Vendor coordination and timeline synchronization",
-            "Day-of event coordination and execution"
-        ]
+        return list(_CRITICAL_PATH)
 
     def _get_contingency_plans(self, event: Dict[str, Any]) -> List[str]:
         """Get contingency plans for the event"""
-        plans = [
-            "Backup vendor contacts for critical services",
-            "Weather contingency for outdoor elements",
-            "Timeline flexibility for unexpected delays"
-        ]
-        
-        venue_type = event.get("venue_type", "indoor")
-        if venue_type == "outdoor":
-            plans.extend([
-                "Indoor backup venue arrangement",
-                "Weather monitoring and decision protocols"
-            ])
-        
-        return plans
+        if event.get("venue_type", "indoor") == "outdoor":
+            return list(_BASE_CONTINGENCY_PLANS + _OUTDOOR_CONTINGENCY_PLANS)
+        return list(_BASE_CONTINGENCY_PLANS)
 
     def _generate_timeline_alternatives(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate timeline alternatives"""
-        alternatives = []
-        
-        # Fast-track alternative
-        alternatives.append({
-            "name": "Fast-Track Timeline",
-            "description": "Compressed timeline with parallel activities",
-            "timeline_changes": [
-                "Combine setup activities to save 2 hours",
-                "Parallel vendor coordination",
-                "Streamlined ceremony sequences"
-            ],
-            "cost_impact": -500.0,
-            "time_savings": "4-6 hours total",
-            "trade_offs": [
-                "Less buffer time for delays",
-                "Higher coordination complexity",
-                "Potential stress on vendors"
-            ]
-        })
-        
-        # Premium alternative
-        alternatives.append({
-            "name": "Premium Experience Timeline",
-            "description": "Extended timeline with luxury touches",
-            "timeline_changes": [
-                "Extended preparation time for premium setup",
-                "Additional entertainment segments",
-                "Professional coordination throughout"
-            ],
-            "cost_impact": 2000.0,
-            "time_savings": None,
-            "trade_offs": [
-                "Higher budget requirements",
-                "Longer event duration",
-                "Premium vendor requirements"
-            ]
-        })
-        
-        return alternatives
+        # Copied so callers can't change the shared module-level alternatives
+        return deepcopy(list(_TIMELINE_ALTERNATIVES))
 
     def _generate_budget_alternatives(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate budget alternatives"""
-        alternatives = []
-        
-        # Budget-conscious alternative
-        alternatives.append({
-            "name": "Budget-Conscious Allocation",
-            "description": "Cost-optimized budget distribution",
-            "category_changes": {
-                "venue": -1000.0,
-                "catering": -1500.0,
-                "decoration": -500.0,
-                "entertainment": -300.0
-            },
-            "total_budget_change": -3300.0,
-            "impact_analysis": [
-                "Simpler venue options",
-                "Buffet-style catering",
-                "DIY decoration elements",
-                "Playlist instead of live entertainment"
-            ]
-        })
-        
-        # Premium alternative
-        alternatives.append({
-            "name": "Premium Experience Allocation",
-            "description": "Luxury-focused budget distribution",
-            "category_changes": {
-                "venue": 2000.0,
-                "catering": 3000.0,
-                "entertainment": 1500.0,
-                "photography": 1000.0
-            },
-            "total_budget_change": 7500.0,
-            "impact_analysis": [
-                "Premium venue with full services",
-                "Multi-course plated dining",
-                "Live entertainment and performances",
-                "Professional photography and videography"
-            ]
-        })
-        
-        return alternatives
+        return deepcopy(list(_BUDGET_ALTERNATIVES))
 
     def _generate_alternative_recommendations(self, event: Dict[str, Any], 
                                            timeline_alternatives: List[Dict[str, Any]], 
                                            budget_alternatives: List[Dict[str, Any]]) -> List[str]:
         """Generate recommendations for alternatives"""
-        recommendations = []
-        
         guest_count = event.get("guest_count", 100)
         budget = event.get("budget", 10000)
         
+        head = ()
         if guest_count > 200:
-            recommendations.append("Consider fast-track timeline for large events to manage logistics")
+            head += ("Consider fast-track timeline for large events to manage logistics",)
         
         if budget and budget < 50000:
-            recommendations.append("Budget-conscious allocation recommended for cost optimization")
+            head += ("Budget-conscious allocation recommended for cost optimization",)
         elif budget and budget > 100000:
-            recommendations.append("Premium experience allocation can enhance guest satisfaction")
-        
-        recommendations.extend([
-            "Review trade-offs carefully before selecting alternatives",
-            "Consider hybrid approaches combining elements from different alternatives",
-            "Consult with vendors about feasibility of timeline changes"
-        ])
+            head += ("Premium experience allocation can enhance guest satisfaction",)
         
-        return recommendations
+        return list(head + _GENERAL_ALTERNATIVE_RECOMMENDATIONS)
 
     def _check_modification_warnings(self, modification_data: Dict[str, Any], 
                                    current_allocation: Dict[str, Any]) -> List[str]:
@@ -1104,15 +1373,19 @@ class EventService:
         warnings = []
         
         category_changes = modification_data.get("category_changes", {})
+        current_categories = current_allocation.get("categories", {})
         
         for category, new_amount in category_changes.items():
-            if category in current_allocation.get("categories", {}):
-                current_amount = current_allocation["categories"][category]["amount"]
-                change_percent = ((new_amount - current_amount) / current_amount) * 100
+            if category in current_categories:
+                current_amount = current_categories[category]["amount"]
                 
-                if change_percent < -50:
+                # Cutting more than half or more than doubling warrants a warning; the
+                # exact percentage is only worked out for the message
+                if new_amount < current_amount * 0.5:
+                    change_percent = ((new_amount - current_amount) / current_amount) * 100
                     warnings.append(f"Reducing {category} by {abs(change_percent):.1f}% may significantly impact quality")
-                elif change_percent > 100:
+                elif new_amount > current_amount * 2:
+                    change_percent = ((new_amount - current_amount) / current_amount) * 100
                     warnings.append(f"Increasing {category} by {change_percent:.1f}% may be excessive")
         
         return warnings
@@ -1122,13 +1395,7 @@ class EventService:
         # This would integrate with the pattern learning system
         # For now, return a simple message
         overall_rating = feedback_data.get("overall_satisfaction", 3)
-        
-        if overall_rating >= 4:
-            return "Positive feedback will reinforce successful patterns for similar events"
-        elif overall_rating <= 2:
-            return "Feedback will help identify areas for improvement in future recommendations"
-        else:
-            return "Feedback will contribute to pattern refinement and optimization"
+        return _FEEDBACK_LEARNING_MESSAGES[0 if overall_rating <= 2 else 2 if overall_rating >= 4 else 1]
 
     def _generate_approach_based_alternatives(self, event: Dict[str, Any], approach: str) -> List[Dict[str, Any]]:
         """Generate alternatives based on specific approach"""
@@ -1169,30 +1436,7 @@ class EventService:
 
     def _get_approach_recommendations(self, approach: str) -> List[str]:
         """Get recommendations for specific approach"""
-        recommendations = {
-            "fast": [
-                "Book vendors who offer express services",
-                "Choose venues with built-in amenities",
-                "Prepare detailed timeline with all stakeholders"
-            ],
-            "premium": [
-                "Invest in professional event coordination",
-                "Book premium vendors well in advance",
-                "Consider guest experience at every touchpoint"
-            ],
-            "budget": [
-                "Prioritize essential elements over nice-to-haves",
-                "Leverage family and friends for support",
-                "Focus on meaningful experiences over expensive items"
-            ],
-            "balanced": [
-                "Balance cost and quality across all categories",
-                "Allocate budget based on event priorities",
-                "Maintain flexibility for adjustments"
-            ]
-        }
-        
-        return recommendations.get(approach, recommendations["balanced"])
+        return list(_APPROACH_RECOMMENDATIONS.get(approach, _APPROACH_RECOMMENDATIONS["balanced"]))
 
     def _generate_budget_scenarios(self, event: Dict[str, Any], scenario: str) -> List[Dict[str, Any]]:
         """Generate budget scenarios"""
@@ -1239,27 +1483,4 @@ class EventService:
 
     def _get_scenario_recommendations(self, scenario: str) -> List[str]:
         """Get recommendations for budget scenarios"""
-        recommendations = {
-            "budget_conscious": [
-                "Focus spending on high-impact elements",
-                "Consider off-peak timing for better rates",
-                "Leverage personal networks for cost savings"
-            ],
-            "premium": [
-                "Book premium vendors well in advance",
-                "Consider package deals for better value",
-                "Invest in professional coordination"
-            ],
-            "emergency": [
-                "Be flexible with vendor and venue options",
-                "Expect to pay premium for short notice",
-                "Focus on essential elements first"
-            ],
-            "standard": [
-                "Balance quality and cost across categories",
-                "Plan 3-6 months in advance for best options",
-                "Keep 10-15% contingency for unexpected costs"
-            ]
-        }
-        
-        return recommendations.get(scenario, recommendations["standard"])
\ No newline at end of file
+        return list(_SCENARIO_RECOMMENDATIONS.get(scenario, _SCENARIO_RECOMMENDATIONS["standard"]))
\ No newline at end of file
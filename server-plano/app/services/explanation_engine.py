@@ -2,7 +2,9 @@
 Explanation Engine for providing detailed reasoning behind budget and timeline decisions.
 """
 from typing import Dict, List, Any, Optional
+from copy import deepcopy
 from decimal import Decimal
+from operator import itemgetter
 import logging
 
 from ..models.core import EventContext, BudgetAllocation, Timeline, CategoryAllocation
@@ -10,6 +12,181 @@ from ..models.enums import BudgetCategory, EventType, VenueType, BudgetTier, Sea
 
 logger = logging.getLogger(__name__)
 
+# Summary of what each budget tier buys
+_TIER_EXPLANATIONS = {
+    BudgetTier.LOW: "Budget-conscious approach focusing on essential elements",
+    BudgetTier.STANDARD: "Balanced approach with good quality across all categories",
+    BudgetTier.PREMIUM: "Enhanced experience with premium vendors and services",
+    BudgetTier.LUXURY: "Luxury experience with top-tier vendors and exclusive services"
+}
+
+# Reasoning for a category allocation, formatted with the context's venue_type,
+# guest_count, budget_tier and event_type values
+_CATEGORY_REASONING_TEMPLATES = {
+    BudgetCategory.VENUE: "Venue allocation reflects {venue_type} requirements for {guest_count} guests",
+    BudgetCategory.CATERING: "Catering budget scaled for {guest_count} guests with {budget_tier} tier service quality",
+    BudgetCategory.DECORATION: "Decoration allocation considers {event_type} aesthetic requirements and venue enhancement needs",
+    BudgetCategory.ENTERTAINMENT: "Entertainment budget reflects {event_type} celebration requirements and guest engagement needs",
+    BudgetCategory.PHOTOGRAPHY: "Photography allocation ensures professional documentation of {event_type} memories",
+    BudgetCategory.TRANSPORTATION: "Transportation budget accounts for guest logistics and vendor coordination needs",
+    BudgetCategory.MISCELLANEOUS: "Contingency allocation provides buffer for unexpected costs and minor items"
+}
+
+# Pricing effect of each season
+_SEASONAL_EFFECTS = {
+    Season.WINTER: "Peak wedding season in India - higher vendor demand and pricing",
+    Season.SPRING: "Pleasant weather season with moderate vendor availability",
+    Season.SUMMER: "Hot weather season - lower demand for outdoor events, potential savings",
+    Season.MONSOON: "Monsoon season - lowest vendor demand, significant cost savings possible",
+    Season.AUTUMN: "Post-monsoon season - good weather returning, moderate pricing"
+}
+
+_EVENT_TYPE_IMPACTS = {
+    EventType.WEDDING: "Weddings typically require higher catering and decoration budgets for ceremonial significance",
+    EventType.CORPORATE: "Corporate events emphasize venue quality and professional services over decorative elements",
+    EventType.BIRTHDAY: "Birthday celebrations focus on entertainment and catering with moderate decoration needs",
+    EventType.ANNIVERSARY: "Anniversary events balance intimate atmosphere with celebration requirements"
+}
+
+_VENUE_IMPACTS = {
+    VenueType.OUTDOOR: "Outdoor venues require additional weather protection, power, and logistics costs",
+    VenueType.INDOOR: "Indoor venues provide controlled environment with standard service requirements",
+    VenueType.HOME: "Home venues reduce venue costs but increase decoration and setup requirements",
+    VenueType.HOTEL: "Hotel venues offer comprehensive services but at premium pricing",
+    VenueType.BANQUET_HALL: "Banquet halls provide dedicated event space with standard amenities"
+}
+
+# Budget factors listed for each season
+_SEASONAL_FACTORS = {
+    Season.WINTER: (
+        "Peak wedding season increases vendor demand",
+        "Flower prices at seasonal high",
+        "Premium venue booking rates",
+        "Higher photographer availability costs"
+    ),
+    Season.SPRING: (
+        "Pleasant weather reduces contingency needs",
+        "Seasonal flowers available at moderate prices",
+        "Good vendor availability",
+        "Optimal conditions for outdoor elements"
+    ),
+    Season.SUMMER: (
+        "Hot weather increases cooling costs",
+        "Lower demand for outdoor venues creates savings opportunities",
+        "Indoor venue preference affects allocation",
+        "Hydration and comfort considerations"
+    ),
+    Season.MONSOON: (
+        "Weather contingency planning essential",
+        "Indoor venue requirements increase costs",
+        "Transportation challenges affect logistics budget",
+        "Lowest vendor demand creates cost savings"
+    ),
+    Season.AUTUMN: (
+        "Post-monsoon recovery period",
+        "Moderate weather conditions",
+        "Festival season affects vendor availability",
+        "Good balance of cost and weather factors"
+    )
+}
+_DEFAULT_SEASONAL_FACTORS = ("Standard seasonal considerations applied",)
+
+# Budget impact lines for cultural requirements with specific needs, by requirement value
+_CULTURAL_IMPACTS = {
+    "hindu": (
+        "Hindu ceremonies require specialized priests and ritual items",
+        "Traditional decorations with flowers and rangoli increase decoration costs",
+        "Multiple ceremony days may extend venue and catering needs"
+    ),
+    "muslim": (
+        "Islamic ceremonies require halal catering considerations",
+        "Nikah ceremony setup requires specific arrangements",
+        "Gender-separated arrangements may affect venue layout"
+    ),
+    "christian": (
+        "Church ceremony coordination may require additional planning",
+        "Reception setup follows ceremony requirements",
+        "Traditional music and decoration elements"
+    )
+}
+
+# Industry standard allocation ranges (percent of total budget) by event type
+_INDUSTRY_STANDARD_RANGES = {
+    EventType.WEDDING: {
+        BudgetCategory.VENUE: (20, 30),
+        BudgetCategory.CATERING: (35, 45),
+        BudgetCategory.DECORATION: (10, 20),
+        BudgetCategory.PHOTOGRAPHY: (8, 15),
+        BudgetCategory.ENTERTAINMENT: (5, 12),
+        BudgetCategory.TRANSPORTATION: (2, 8),
+        BudgetCategory.MISCELLANEOUS: (5, 15)
+    },
+    EventType.CORPORATE: {
+        BudgetCategory.VENUE: (25, 35),
+        BudgetCategory.CATERING: (20, 35),
+        BudgetCategory.ENTERTAINMENT: (10, 20),
+        BudgetCategory.PHOTOGRAPHY: (5, 12),
+        BudgetCategory.TRANSPORTATION: (8, 15),
+        BudgetCategory.MISCELLANEOUS: (5, 10)
+    }
+}
+
+# (event_type, category) -> (min_pct, max_pct, below, within, above) comparison messages
+_INDUSTRY_STANDARDS = {
+    (event_type, category): (
+        min_pct,
+        max_pct,
+        f"Below typical range ({min_pct}-{max_pct}%) - optimized for budget efficiency",
+        f"Within industry standard range ({min_pct}-{max_pct}%)",
+        f"Above typical range ({min_pct}-{max_pct}%) - enhanced allocation for quality"
+    )
+    for event_type, ranges in _INDUSTRY_STANDARD_RANGES.items()
+    for category, (min_pct, max_pct) in ranges.items()
+}
+
+# Alternative allocation approaches suggested for every event; handed out as deep copies
+_ALTERNATIVE_APPROACHES = (
+    # Budget-conscious alternative
+    {
+        "name": "Budget-Conscious Approach",
+        "description": "Reduce costs while maintaining quality",
+        "key_changes": [
+            "Optimize venue selection for value",
+            "Choose buffet over plated service",
+            "Focus on essential photography coverage",
+            "Simplify decoration themes"
+        ],
+        "estimated_savings": "15-25%",
+        "trade_offs": ["Reduced luxury elements", "Simpler service style"]
+    },
+    # Premium experience alternative
+    {
+        "name": "Premium Experience Approach",
+        "description": "Enhance guest experience with premium services",
+        "key_changes": [
+            "Upgrade to luxury venue",
+            "Add premium catering options",
+            "Include comprehensive photography/videography",
+            "Enhance decoration and ambiance"
+        ],
+        "estimated_cost_increase": "20-35%",
+        "benefits": ["Enhanced guest experience", "Premium service quality", "Lasting memories"]
+    },
+)
+
+# Balanced reallocation alternative, added for weddings
+_WEDDING_ALTERNATIVE_APPROACH = {
+    "name": "Experience-Focused Reallocation",
+    "description": "Prioritize guest experience over traditional allocations",
+    "key_changes": [
+        "Increase entertainment budget for memorable experiences",
+        "Enhance catering with interactive stations",
+        "Reduce venue costs by choosing unique but affordable locations",
+        "Invest in professional coordination services"
+    ],
+    "philosophy": "Create unforgettable experiences rather than traditional displays"
+}
+
 
 class ExplanationEngine:
     """
@@ -93,14 +270,6 @@ class ExplanationEngine:
         """Explain the total budget and per-person cost reasoning"""
         per_person = allocation.per_person_cost
         
-        # Determine budget tier explanation
-        tier_explanation = {
-            BudgetTier.LOW: "Budget-conscious approach focusing on essential elements",
-            BudgetTier.STANDARD: "Balanced approach with good quality across all categories",
-            BudgetTier.PREMIUM: "Enhanced experience with premium vendors and services",
-            BudgetTier.LUXURY: "Luxury experience with top-tier vendors and exclusive services"
-        }
-        
         # Regional cost context
         regional_factor = allocation.regional_adjustments.get('multiplier', 1.0)
         regional_explanation = ""
@@ -115,7 +284,7 @@ class ExplanationEngine:
             "total_amount": float(allocation.total_budget),
             "per_person_cost": float(per_person),
             "budget_tier": context.budget_tier.value,
-            "tier_explanation": tier_explanation.get(context.budget_tier, "Standard approach"),
+            "tier_explanation": _TIER_EXPLANATIONS.get(context.budget_tier, "Standard approach"),
             "regional_context": regional_explanation,
             "guest_count_impact": self._explain_guest_count_impact(context.guest_count),
             "seasonal_impact": self._explain_seasonal_impact(context.season, allocation.seasonal_adjustments)
@@ -123,22 +292,28 @@ class ExplanationEngine:
     
     def _explain_categories(self, allocation: BudgetAllocation, context: EventContext) -> List[Dict[str, Any]]:
         """Explain each budget category allocation"""
-        explanations = []
+        get_reasoning = self._get_category_reasoning
+        get_factors = self._get_category_factors
+        get_comparison = self._get_industry_comparison
+        get_notes = self._get_category_optimization_notes
+        event_type = context.event_type
         
-        for category, cat_allocation in allocation.categories.items():
-            explanation = {
+        explanations = [
+            {
                 "category": category.value,
                 "amount": float(cat_allocation.amount),
                 "percentage": cat_allocation.percentage,
                 "priority": cat_allocation.priority.value,
-                "reasoning": self._get_category_reasoning(category, cat_allocation, context),
-                "factors_considered": self._get_category_factors(category, context),
-                "industry_comparison": self._get_industry_comparison(category, cat_allocation.percentage, context.event_type),
-                "optimization_notes": self._get_category_optimization_notes(category, context)
+                "reasoning": get_reasoning(category, cat_allocation, context),
+                "factors_considered": get_factors(category, context),
+                "industry_comparison": get_comparison(category, cat_allocation.percentage, event_type),
+                "optimization_notes": get_notes(category, context)
             }
-            explanations.append(explanation)
+            for category, cat_allocation in allocation.categories.items()
+        ]
+        explanations.sort(key=itemgetter("amount"), reverse=True)
         
-        return sorted(explanations, key=lambda x: x["amount"], reverse=True)
+        return explanations
     
     def _explain_contextual_factors(self, context: EventContext) -> Dict[str, Any]:
         """Explain how context influenced the allocation"""
@@ -161,17 +336,16 @@ class ExplanationEngine:
     
     def _get_category_reasoning(self, category: BudgetCategory, allocation: CategoryAllocation, context: EventContext) -> str:
         """Get specific reasoning for a category allocation"""
-        base_reasoning = {
-            BudgetCategory.VENUE: f"Venue allocation reflects {context.venue_type.value} requirements for {context.guest_count} guests",
-            BudgetCategory.CATERING: f"Catering budget scaled for {context.guest_count} guests with {context.budget_tier.value} tier service quality",
-            BudgetCategory.DECORATION: f"Decoration allocation considers {context.event_type.value} aesthetic requirements and venue enhancement needs",
-            BudgetCategory.ENTERTAINMENT: f"Entertainment budget reflects {context.event_type.value} celebration requirements and guest engagement needs",
-            BudgetCategory.PHOTOGRAPHY: f"Photography allocation ensures professional documentation of {context.event_type.value} memories",
-            BudgetCategory.TRANSPORTATION: f"Transportation budget accounts for guest logistics and vendor coordination needs",
-            BudgetCategory.MISCELLANEOUS: f"Contingency allocation provides buffer for unexpected costs and minor items"
-        }
-        
-        reasoning = base_reasoning.get(category, f"Standard allocation for {category.value}")
+        template = _CATEGORY_REASONING_TEMPLATES.get(category)
+        if template is None:
+            reasoning = f"Standard allocation for {category.value}"
+        else:
+            reasoning = template.format(
+                venue_type=context.venue_type.value,
+                guest_count=context.guest_count,
+                budget_tier=context.budget_tier.value,
+                event_type=context.event_type.value
+            )
         
         # Add context-specific adjustments
         if context.venue_type == VenueType.OUTDOOR and category == BudgetCategory.MISCELLANEOUS:
@@ -227,38 +401,18 @@ class ExplanationEngine:
     
     def _get_industry_comparison(self, category: BudgetCategory, percentage: float, event_type: EventType) -> str:
         """Compare allocation percentage to industry standards"""
-        # Industry standard ranges by event type
-        standards = {
-            EventType.WEDDING: {
-                BudgetCategory.VENUE: (20, 30),
-                BudgetCategory.CATERING: (35, 45),
-                BudgetCategory.DECORATION: (10, 20),
-                BudgetCategory.PHOTOGRAPHY: (8, 15),
-                BudgetCategory.ENTERTAINMENT: (5, 12),
-                BudgetCategory.TRANSPORTATION: (2, 8),
-                BudgetCategory.MISCELLANEOUS: (5, 15)
-            },
-            EventType.CORPORATE: {
-                BudgetCategory.VENUE: (25, 35),
-                BudgetCategory.CATERING: (20, 35),
-                BudgetCategory.ENTERTAINMENT: (10, 20),
-                BudgetCategory.PHOTOGRAPHY: (5, 12),
-                BudgetCategory.TRANSPORTATION: (8, 15),
-                BudgetCategory.MISCELLANEOUS: (5, 10)
-            }
-        }
-        
-        if event_type not in standards or category not in standards[event_type]:
+        entry = _INDUSTRY_STANDARDS.get((event_type, category))
+        if entry is None:
             return "Within typical range for this event type"
         
-        min_pct, max_pct = standards[event_type][category]
+        min_pct, max_pct, below, within, above = entry
         
         if percentage < min_pct:
-            return f"Below typical range ({min_pct}-{max_pct}%) - optimized for budget efficiency"
+            return below
         elif percentage > max_pct:
-            return f"Above typical range ({min_pct}-{max_pct}%) - enhanced allocation for quality"
+            return above
         else:
-            return f"Within industry standard range ({min_pct}-{max_pct}%)"
+            return within
     
     def _get_category_optimization_notes(self, category: BudgetCategory, context: EventContext) -> List[str]:
         """Get optimization notes for a category"""
@@ -291,15 +445,7 @@ class ExplanationEngine:
     
     def _explain_seasonal_impact(self, season: Season, seasonal_adjustments: Dict) -> str:
         """Explain seasonal cost impacts"""
-        seasonal_effects = {
-            Season.WINTER: "Peak wedding season in India - higher vendor demand and pricing",
-            Season.SPRING: "Pleasant weather season with moderate vendor availability",
-            Season.SUMMER: "Hot weather season - lower demand for outdoor events, potential savings",
-            Season.MONSOON: "Monsoon season - lowest vendor demand, significant cost savings possible",
-            Season.AUTUMN: "Post-monsoon season - good weather returning, moderate pricing"
-        }
-        
-        base_explanation = seasonal_effects.get(season, "Standard seasonal pricing")
+        base_explanation = _SEASONAL_EFFECTS.get(season, "Standard seasonal pricing")
         
         if seasonal_adjustments:
             adjustment_details = []
@@ -315,26 +461,11 @@ class ExplanationEngine:
     
     def _explain_event_type_impact(self, event_type: EventType) -> str:
         """Explain how event type influences allocation"""
-        explanations = {
-            EventType.WEDDING: "Weddings typically require higher catering and decoration budgets for ceremonial significance",
-            EventType.CORPORATE: "Corporate events emphasize venue quality and professional services over decorative elements",
-            EventType.BIRTHDAY: "Birthday celebrations focus on entertainment and catering with moderate decoration needs",
-            EventType.ANNIVERSARY: "Anniversary events balance intimate atmosphere with celebration requirements"
-        }
-        
-        return explanations.get(event_type, f"{event_type.value} events have specific allocation patterns")
+        return _EVENT_TYPE_IMPACTS.get(event_type, f"{event_type.value} events have specific allocation patterns")
     
     def _explain_venue_impact(self, venue_type: VenueType) -> str:
         """Explain venue type impact on budget"""
-        impacts = {
-            VenueType.OUTDOOR: "Outdoor venues require additional weather protection, power, and logistics costs",
-            VenueType.INDOOR: "Indoor venues provide controlled environment with standard service requirements",
-            VenueType.HOME: "Home venues reduce venue costs but increase decoration and setup requirements",
-            VenueType.HOTEL: "Hotel venues offer comprehensive services but at premium pricing",
-            VenueType.BANQUET_HALL: "Banquet halls provide dedicated event space with standard amenities"
-        }
-        
-        return impacts.get(venue_type, f"{venue_type.value} venues have specific cost implications")
+        return _VENUE_IMPACTS.get(venue_type, f"{venue_type.value} venues have specific cost implications")
     
     def _explain_guest_count_effects(self, guest_count: int) -> List[str]:
         """Explain specific effects of guest count on different categories"""
@@ -368,24 +499,9 @@ class ExplanationEngine:
         for requirement in cultural_requirements:
             if hasattr(requirement, 'value'):
                 req_name = requirement.value
-                if req_name == "hindu":
-                    impacts.extend([
-                        "Hindu ceremonies require specialized priests and ritual items",
-                        "Traditional decorations with flowers and rangoli increase decoration costs",
-                        "Multiple ceremony days may extend venue and catering needs"
-                    ])
-                elif req_name == "muslim":
-                    impacts.extend([
-                        "Islamic ceremonies require halal catering considerations",
-                        "Nikah ceremony setup requires specific arrangements",
-                        "Gender-separated arrangements may affect venue layout"
-                    ])
-                elif req_name == "christian":
-                    impacts.extend([
-                        "Church ceremony coordination may require additional planning",
-                        "Reception setup follows ceremony requirements",
-                        "Traditional music and decoration elements"
-                    ])
+                requirement_impacts = _CULTURAL_IMPACTS.get(req_name)
+                if requirement_impacts is not None:
+                    impacts.extend(requirement_impacts)
                 else:
                     impacts.append(f"{req_name} cultural requirements considered in planning")
         
@@ -393,40 +509,7 @@ class ExplanationEngine:
     
     def _explain_seasonal_factors(self, season: Season) -> List[str]:
         """Explain seasonal factors affecting budget"""
-        factors = {
-            Season.WINTER: [
-                "Peak wedding season increases vendor demand",
-                "Flower prices at seasonal high",
-                "Premium venue booking rates",
-                "Higher photographer availability costs"
-            ],
-            Season.SPRING: [
-                "Pleasant weather reduces contingency needs",
-                "Seasonal flowers available at moderate prices",
-                "Good vendor availability",
-                "Optimal conditions for outdoor elements"
-            ],
-            Season.SUMMER: [
-                "Hot weather increases cooling costs",
-                "Lower demand for outdoor venues creates savings opportunities",
-                "Indoor venue preference affects allocation",
-                "Hydration and comfort considerations"
-            ],
-            Season.MONSOON: [
-                "Weather contingency planning essential",
-                "Indoor venue requirements increase costs",
-                "Transportation challenges affect logistics budget",
-                "Lowest vendor demand creates cost savings"
-            ],
-            Season.AUTUMN: [
-                "Post-monsoon recovery period",
-                "Moderate weather conditions",
-                "Festival season affects vendor availability",
-                "Good balance of cost and weather factors"
-            ]
-        }
-        
-        return factors.get(season, ["Standard seasonal considerations applied"])
+        return list(_SEASONAL_FACTORS.get(season, _DEFAULT_SEASONAL_FACTORS))
     
     def _explain_duration_impact(self, duration_days: int) -> str:
         """Explain how event duration affects budget"""
@@ -475,10 +558,11 @@ class ExplanationEngine:
         
         # Analyze allocation patterns
         total_budget = allocation.total_budget
-        venue_pct = next((cat_alloc.percentage for cat, cat_alloc in allocation.categories.items() 
-                         if cat == BudgetCategory.VENUE), 0)
-        catering_pct = next((cat_alloc.percentage for cat, cat_alloc in allocation.categories.items() 
-                           if cat == BudgetCategory.CATERING), 0)
+        categories = allocation.categories
+        venue_allocation = categories.get(BudgetCategory.VENUE)
+        venue_pct = venue_allocation.percentage if venue_allocation is not None else 0
+        catering_allocation = categories.get(BudgetCategory.CATERING)
+        catering_pct = catering_allocation.percentage if catering_allocation is not None else 0
         
         if venue_pct > 30:
             decisions.append("Venue allocation prioritized for premium location and facilities")
@@ -532,49 +616,11 @@ class ExplanationEngine:
     
     def _suggest_alternative_approaches(self, allocation: BudgetAllocation, context: EventContext) -> List[Dict[str, Any]]:
         """Suggest alternative allocation approaches"""
-        alternatives = []
-        
-        # Budget-conscious alternative
-        alternatives.append({
-            "name": "Budget-Conscious Approach",
-            "description": "Reduce costs while maintaining quality",
-            "key_changes": [
-                "Optimize venue selection for value",
-                "Choose buffet over plated service",
-                "Focus on essential photography coverage",
-                "Simplify decoration themes"
-            ],
-            "estimated_savings": "15-25%",
-            "trade_offs": ["Reduced luxury elements", "Simpler service style"]
-        })
-        
-        # Premium experience alternative
-        alternatives.append({
-            "name": "Premium Experience Approach",
-            "description": "Enhance guest experience with premium services",
-            "key_changes": [
-                "Upgrade to luxury venue",
-                "Add premium catering options",
-                "Include comprehensive photography/videography",
-                "Enhance decoration and ambiance"
-            ],
-            "estimated_cost_increase": "20-35%",
-            "benefits": ["Enhanced guest experience", "Premium service quality", "Lasting memories"]
-        })
-        
-        # Balanced reallocation alternative
+        # Copied so callers can't change the shared module-level approaches
+        alternatives = deepcopy(list(_ALTERNATIVE_APPROACHES))
+        
         if context.event_type == EventType.WEDDING:
-            alternatives.append({
-                "name": "Experience-Focused Reallocation",
-                "description": "Prioritize guest experience over traditional allocations",
-                "key_changes": [
-                    "Increase entertainment budget for memorable experiences",
-                    "Enhance catering with interactive stations",
-                    "Reduce venue costs by choosing unique but affordable locations",
-                    "Invest in professional coordination services"
-                ],
-                "philosophy": "Create unforgettable experiences rather than traditional displays"
-            })
+            alternatives.append(deepcopy(_WEDDING_ALTERNATIVE_APPROACH))
         
         return alternatives
     
@@ -1,8 +1,12 @@
 from supabase import create_client, Client
+from postgrest.exceptions import APIError
 from app.config import Config
 from typing import Optional, Dict, List, Any
 import json
 from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
 
 class SupabaseClient:
     def __init__(self):
@@ -10,6 +14,8 @@ class SupabaseClient:
             Config.SUPABASE_URL, 
             Config.SUPABASE_SERVICE_ROLE_KEY
         )
+        # Cleared once the database reports the create_event_children function is missing
+        self._event_children_rpc_available = True
 
     def create_event(self, user_id: str, event_data: Dict) -> Dict:
         """Create a new event and return the created event with ID"""
@@ -34,9 +40,43 @@ class SupabaseClient:
         result = self.client.table("event_days").insert(event_days).execute()
         return result.data or []
 
-    def get_event_days(self, event_id: int) -> List[Dict]:
-        """Get all days for an event"""
-        result = self.client.table("event_days").select("*").eq("event_id", event_id).order("day_number").execute()
+    def create_event_children(self, event_days: List[Dict], vendors: List[Dict]) -> None:
+        """Create an event's days and vendors in one round-trip and transaction.
+
+        Uses the create_event_children database function, falling back to separate
+        inserts when the call fails.
+        """
+        if self._event_children_rpc_available:
+            try:
+                self.client.rpc("create_event_children", {
+                    "p_event_days": event_days,
+                    "p_vendors": vendors
+                }).execute()
+                return
+            except APIError as e:
+                # PGRST202: function not found in the schema cache, so stop calling it.
+                # Any other error rolled the function's transaction back, so nothing was
+                # written and the separate inserts can still be tried.
+                if e.code == "PGRST202":
+                    self._event_children_rpc_available = False
+                logger.warning(f"create_event_children failed, using separate inserts: {e!r}")
+
+        self.create_event_days(event_days)
+        if vendors:
+            self.create_vendors(vendors)
+
+    def delete_event(self, event_id: int, user_id: str) -> None:
+        """Delete a user's event together with its days and vendors"""
+        self.client.table("vendors").delete().eq("event_id", event_id).execute()
+        self.client.table("event_days").delete().eq("event_id", event_id).execute()
+        self.client.table("events").delete().eq("id", event_id).eq("user_id", user_id).execute()
+
+    def get_event_days(self, event_id: int, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """Get the days for an event, optionally only `limit` of them starting at `offset`"""
+        query = self.client.table("event_days").select("*").eq("event_id", event_id).order("day_number")
+        if limit is not None:
+            query = query.range(offset, offset + limit - 1)
+        result = query.execute()
         return result.data or []
 
     def get_event_day(self, event_id: int, day_number: int) -> Optional[Dict]:
@@ -67,11 +107,6 @@ class SupabaseClient:
         # For now, we'll keep it simple and fetch vendors per event
         return []
 
-    def verify_user_owns_event(self, event_id: int, user_id: str) -> bool:
-        """Verify that user owns the event"""
-        event = self.get_event(event_id, user_id)
-        return event is not None
-
     # Pattern Learning System Database Methods
     
     def store_event_pattern(self, user_id: str, pattern_data: Dict) -> Optional[Dict]:
@@ -128,6 +128,23 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Inserts an event's timeline days and vendors in one transaction, so the API can
+-- write both with a single RPC round-trip after creating the event. The payloads are
+-- read with the event_days and vendors row types, which are defined outside this file;
+-- if the call fails the API falls back to inserting into each table directly.
+CREATE OR REPLACE FUNCTION create_event_children(p_event_days JSONB, p_vendors JSONB)
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO event_days (event_id, day_number, date, summary, estimated_cost, details, notes, contingency_plans)
+    SELECT event_id, day_number, date, summary, estimated_cost, details, notes, contingency_plans
+    FROM jsonb_populate_recordset(NULL::event_days, p_event_days);
+
+    INSERT INTO vendors (event_id, title, url, snippet, search_query, source)
+    SELECT event_id, title, url, snippet, search_query, source
+    FROM jsonb_populate_recordset(NULL::vendors, p_vendors);
+END;
+$$ language 'plpgsql';
+
 -- Triggers to automatically update updated_at
 CREATE TRIGGER update_event_patterns_updated_at BEFORE UPDATE ON event_patterns 
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
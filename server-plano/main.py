@@ -1,5 +1,7 @@
 from fastapi import FastAPI, HTTPException, Depends
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from app.schemas import (
     EventRequest, EventResponse, VendorResult, EventSummary,
     BudgetExplanationResponse, TimelineReasoningResponse, AlternativesResponse,
@@ -7,9 +9,16 @@ from app.schemas import (
 )
 from app.services.event_service import EventService
 from app.utils.auth import get_current_user_id
-from typing import List
+from typing import Any, List
+import orjson
 
-app = FastAPI(title="Event Planner API", version="2.0.0")
+
+def _ndjson_line(content: Any) -> bytes:
+    """Serialize one record of a newline-delimited JSON stream, like ORJSONResponse does"""
+    return orjson.dumps(jsonable_encoder(content), option=orjson.OPT_NON_STR_KEYS) + b"\n"
+
+# Event payloads (timelines, vendors, budget breakdowns) are large; render them with orjson
+app = FastAPI(title="Event Planner API", version="2.0.0", default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], 
@@ -53,6 +62,26 @@ async def get_event(
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+@app.get("/events/{event_id}/timeline/stream")
+async def stream_event_timeline(
+    event_id: int,
+    user_id: str = Depends(get_current_user_id)
+):
+    """Stream event details as NDJSON: one header line, then one line per timeline day"""
+    stream = event_service.stream_event_timeline(event_id, user_id)
+    # Resolve the header before responding so a missing event is still a 404
+    try:
+        header = await stream.__anext__()
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    async def lines():
+        yield _ndjson_line(header)
+        async for day in stream:
+            yield _ndjson_line(day)
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
 @app.get("/events/{event_id}/deep-dive/{day_number}")
 async def get_deep_dive(
     event_id: int,
@@ -0,0 +1,7 @@
+import os
+
+# app.config reads these at import time and main.py connects a Supabase client on import;
+# the tests replace the client, so placeholders are enough
+os.environ.setdefault("SUPABASE_URL", "http://localhost")
+os.environ.setdefault("SUPABASE_SERVICE_ROLE_KEY", "test")
+os.environ.setdefault("SUPABASE_ANON_KEY", "test")
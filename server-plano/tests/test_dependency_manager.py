@@ -0,0 +1,37 @@
+import unittest
+from datetime import datetime, timedelta
+
+from app.models.core import Activity, ActivityType, Priority
+from app.services.dependency_manager import DependencyGraph, DependencyManager
+
+
+def _add_activity(graph, activity_id, vendors, start_hour, hours):
+    graph.add_activity(Activity(
+        id=activity_id,
+        name=activity_id,
+        activity_type=ActivityType.CEREMONY,
+        duration=timedelta(hours=hours),
+        priority=Priority.HIGH,
+        required_vendors=vendors,
+    ))
+    node = graph.nodes[activity_id]
+    node.earliest_start = datetime(2026, 1, 1) + timedelta(hours=start_hour)
+    node.earliest_finish = node.earliest_start + timedelta(hours=hours)
+
+
+class ResourceConflictsTest(unittest.TestCase):
+    def test_conflicts_are_reported_in_activity_order(self):
+        graph = DependencyGraph()
+        _add_activity(graph, "mehndi", ["photographer", "caterer"], 2, 3)
+        _add_activity(graph, "haldi", ["photographer", "caterer"], 0, 3)
+
+        conflicts = DependencyManager()._check_resource_conflicts(graph)
+
+        self.assertEqual(conflicts, [
+            "Vendor 'photographer' conflict between activities 'haldi' and 'mehndi'",
+            "Vendor 'caterer' conflict between activities 'haldi' and 'mehndi'",
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
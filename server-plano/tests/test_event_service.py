@@ -0,0 +1,166 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from app.services import event_service
+from app.services.budget_allocation_engine import BudgetAllocationEngine
+from app.services.event_context_analyzer import EventContextAnalyzer
+from app.services.event_service import EventService
+
+
+def _make_service():
+    service = EventService.__new__(EventService)
+    service.context_analyzer = EventContextAnalyzer()
+    service._context_cache = {}
+    return service
+
+
+EVENT = {
+    "event_type": "wedding",
+    "guest_count": 300,
+    "venue_type": "outdoor",
+    "location": "Mumbai, Maharashtra",
+    "religion": "hindu",
+    "special_requirements": ["live music"],
+}
+
+
+class ContextFromEventTest(unittest.TestCase):
+    def test_second_lookup_is_a_cache_hit_with_an_analyzed_context(self):
+        service = _make_service()
+
+        with mock.patch.object(
+            service.context_analyzer, "analyze_context", wraps=service.context_analyzer.analyze_context
+        ) as analyze_context:
+            first = service._context_from_event(EVENT, 500000.0, 3)
+            second = service._context_from_event(dict(EVENT), 500000.0, 3)
+
+        analyze_context.assert_called_once()
+        self.assertIs(second, first)
+        self.assertGreater(first.complexity_score, 0.0)
+        self.assertEqual(first.complexity_score, service.context_analyzer.determine_complexity_score(first))
+        self.assertEqual(first.location.city, "Mumbai")
+        self.assertEqual([requirement.value for requirement in first.cultural_requirements], ["hindu"])
+
+    def test_different_event_fields_are_analyzed_separately(self):
+        service = _make_service()
+
+        first = service._context_from_event(EVENT, 500000.0, 3)
+        second = service._context_from_event(dict(EVENT, guest_count=40), 500000.0, 3)
+
+        self.assertIsNot(second, first)
+        self.assertEqual(second.guest_count, 40)
+        self.assertEqual(len(service._context_cache), 2)
+
+
+class FakeSupabase:
+    """Accepts an event write and echoes the stored row back"""
+
+    def create_event(self, user_id, event_data):
+        return {"id": 5, "user_id": user_id, **event_data}
+
+    def create_event_children(self, event_days, vendors):
+        pass
+
+    def delete_event(self, event_id, user_id):
+        pass
+
+
+CREATE_EVENT_DATA = {
+    "event_type": "wedding",
+    "start_date": "2026-11-01",
+    "end_date": "2026-11-03",
+    "location": "Mumbai, Maharashtra",
+    "religion": "hindu",
+    "guest_count": 300,
+    "venue_type": "outdoor",
+}
+
+
+class CreateEventTest(unittest.TestCase):
+    def setUp(self):
+        self.service = _make_service()
+        self.service.supabase = FakeSupabase()
+        self.service.budget_engine = BudgetAllocationEngine()
+        for name, value in (
+            ("generate_timeline", [{"day": 1, "date": "2026-11-01", "summary": "Haldi"}]),
+            ("search_vendors", []),
+        ):
+            patcher = mock.patch.object(event_service, name, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _create(self, **event_data):
+        return asyncio.run(self.service.create_event("user-1", dict(CREATE_EVENT_DATA, **event_data)))
+
+    def _expected_context(self, budget):
+        return self.service._create_enhanced_context(
+            event_type="wedding", guest_count=300, venue_type="outdoor", location="Mumbai, Maharashtra",
+            religion="hindu", budget=budget, days_count=3, special_requirements=[],
+            accessibility_requirements=[], weather_considerations=[]
+        )
+
+    def _assert_context_analysis(self, response, context):
+        self.assertEqual(response["context_analysis"], {
+            "complexity_score": context.complexity_score,
+            "critical_factors": [
+                factor.name for factor in self.service.context_analyzer.identify_critical_factors(context)[:3]
+            ],
+            "guest_count_category": "large",
+            "venue_complexity": "high",
+        })
+
+    def test_without_budget_estimates_from_the_budget_engine(self):
+        response = self._create(budget=None)
+
+        context = self._expected_context(None)
+        allocation = self.service.budget_engine.allocate_budget(self.service._estimate_base_budget(context), context)
+        self.assertEqual(response["estimated_budget"], float(allocation.total_budget))
+        self.assertEqual(response["event_details"]["estimated_budget"], float(allocation.total_budget))
+        self._assert_context_analysis(response, context)
+
+    def test_with_budget_keeps_the_supplied_budget(self):
+        response = self._create(budget=750000)
+
+        self.assertEqual(response["estimated_budget"], 750000.0)
+        self._assert_context_analysis(response, self._expected_context(750000))
+
+
+class TimelineReasoningTest(unittest.TestCase):
+    def test_deep_dives_are_fetched_a_few_at_a_time(self):
+        service = EventService.__new__(EventService)
+        event = {"id": 1, "event_type": "wedding", "guest_count": 300, "venue_type": "outdoor"}
+        service.supabase = mock.Mock()
+        service.supabase.get_event_days.return_value = [
+            {"day_number": number, "date": f"2026-11-{number:02d}"} for number in range(1, 31)
+        ]
+        running = 0
+        peak = 0
+
+        async def get_owned_event(event_id, user_id):
+            return event
+
+        async def get_deep_dive(event_id, day_number, user_id):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            if day_number == 2:
+                raise Exception("generation failed")
+            return {"deep_dive": {"cultural_considerations": [f"day {day_number}"]}}
+
+        service._get_owned_event = get_owned_event
+        service.get_deep_dive = get_deep_dive
+
+        reasoning = asyncio.run(service.get_timeline_reasoning(1, "user-1"))
+
+        self.assertEqual(peak, event_service._DEEP_DIVE_CONCURRENCY)
+        explanations = reasoning["timeline_explanations"]
+        self.assertEqual([explanation["day"] for explanation in explanations], list(range(1, 31)))
+        self.assertEqual(explanations[0]["cultural_considerations"], ["day 1"])
+        self.assertEqual(explanations[1]["cultural_considerations"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
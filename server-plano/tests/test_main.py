@@ -0,0 +1,79 @@
+import unittest
+from datetime import date
+from unittest import mock
+
+import orjson
+from fastapi.testclient import TestClient
+
+import main
+from app.services.event_service import EventService
+
+
+class FakeSupabase:
+    """Serves one event owned by "user-1" with `day_count` timeline days"""
+
+    def __init__(self, day_count):
+        self.day_count = day_count
+        self.day_queries = []
+
+    def get_event(self, event_id, user_id):
+        if event_id != 1 or user_id != "user-1":
+            return None
+        return {"id": 1, "start_date": date(2026, 11, 1), "estimated_budget": 250000.0}
+
+    def get_event_vendors(self, event_id):
+        return [{"title": "Caterer", "url": "https://example.com", "snippet": "Menus", "id": 7}]
+
+    def get_event_days(self, event_id, offset=0, limit=None):
+        self.day_queries.append((offset, limit))
+        days = [{"day_number": number, "date": date(2026, 11, number)} for number in range(1, self.day_count + 1)]
+        return days[offset:offset + limit] if limit is not None else days
+
+
+class StreamEventTimelineTest(unittest.TestCase):
+    def setUp(self):
+        self.service = EventService.__new__(EventService)
+        self.service._event_cache = {}
+        main.app.dependency_overrides[main.get_current_user_id] = lambda: "user-1"
+        self.addCleanup(main.app.dependency_overrides.clear)
+        patcher = mock.patch.object(main, "event_service", self.service)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = TestClient(main.app)
+
+    def _stream(self, event_id, day_count):
+        self.service.supabase = FakeSupabase(day_count)
+        return self.client.get(f"/events/{event_id}/timeline/stream")
+
+    def test_streams_header_then_one_line_per_day(self):
+        response = self._stream(1, 9)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["content-type"], "application/x-ndjson")
+        lines = [orjson.loads(line) for line in response.content.splitlines()]
+        self.assertEqual(lines[0], {
+            "event_id": 1,
+            "event_details": {"id": 1, "start_date": "2026-11-01", "estimated_budget": 250000.0},
+            "vendors": [{"title": "Caterer", "url": "https://example.com", "snippet": "Menus"}],
+            "estimated_budget": 250000.0,
+        })
+        self.assertEqual([line["day_number"] for line in lines[1:]], list(range(1, 10)))
+        self.assertEqual(lines[1]["date"], "2026-11-01")
+        self.assertEqual(self.service.supabase.day_queries, [(0, 7), (7, 7)])
+
+    def test_unowned_event_is_not_found(self):
+        response = self._stream(2, 3)
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), {"detail": "Event not found or access denied"})
+
+
+class NdjsonLineTest(unittest.TestCase):
+    def test_encodes_one_compact_line(self):
+        line = main._ndjson_line({"day": date(2026, 11, 1), 3: "three"})
+
+        self.assertEqual(line, b'{"day":"2026-11-01","3":"three"}\n')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+
+from postgrest.exceptions import APIError
+
+from app.utils.supabase_client import SupabaseClient
+
+
+class _Query:
+    def __init__(self, client, call):
+        self._client = client
+        self._call = call
+
+    def execute(self):
+        self._client.calls.append(self._call)
+        error = self._client.errors.get(self._call[0])
+        if error is not None:
+            raise error
+        return type("Result", (), {"data": []})()
+
+
+class _Table:
+    def __init__(self, client, name):
+        self._client = client
+        self._name = name
+
+    def insert(self, rows):
+        return _Query(self._client, ("insert", self._name, rows))
+
+
+class FakeClient:
+    """Records rpc calls and table inserts; `errors` maps "rpc"/"insert" to the error raised"""
+
+    def __init__(self, errors=None):
+        self.calls = []
+        self.errors = errors or {}
+
+    def rpc(self, name, params):
+        return _Query(self, ("rpc", name, params))
+
+    def table(self, name):
+        return _Table(self, name)
+
+
+def _make_client(fake):
+    supabase = SupabaseClient.__new__(SupabaseClient)
+    supabase.client = fake
+    supabase._event_children_rpc_available = True
+    return supabase
+
+
+DAYS = [{"event_id": 1, "day_number": 1}]
+VENDORS = [{"event_id": 1, "title": "Caterer"}]
+
+
+class CreateEventChildrenTest(unittest.TestCase):
+    def test_rpc_writes_days_and_vendors_in_one_call(self):
+        fake = FakeClient()
+        supabase = _make_client(fake)
+
+        supabase.create_event_children(DAYS, VENDORS)
+
+        self.assertEqual(fake.calls, [
+            ("rpc", "create_event_children", {"p_event_days": DAYS, "p_vendors": VENDORS})
+        ])
+        self.assertTrue(supabase._event_children_rpc_available)
+
+    def test_missing_function_falls_back_and_stops_calling_it(self):
+        fake = FakeClient({"rpc": APIError({"code": "PGRST202", "message": "not found"})})
+        supabase = _make_client(fake)
+
+        with self.assertLogs("app.utils.supabase_client", level="WARNING"):
+            supabase.create_event_children(DAYS, VENDORS)
+        supabase.create_event_children(DAYS, [])
+
+        self.assertEqual(fake.calls, [
+            ("rpc", "create_event_children", {"p_event_days": DAYS, "p_vendors": VENDORS}),
+            ("insert", "event_days", DAYS),
+            ("insert", "vendors", VENDORS),
+            ("insert", "event_days", DAYS),
+        ])
+        self.assertFalse(supabase._event_children_rpc_available)
+
+    def test_other_rpc_errors_fall_back_for_that_call_only(self):
+        fake = FakeClient({"rpc": APIError({"code": "42703", "message": "column does not exist"})})
+        supabase = _make_client(fake)
+
+        with self.assertLogs("app.utils.supabase_client", level="WARNING"):
+            supabase.create_event_children(DAYS, VENDORS)
+
+        self.assertEqual([call[:2] for call in fake.calls], [
+            ("rpc", "create_event_children"),
+            ("insert", "event_days"),
+            ("insert", "vendors"),
+        ])
+        self.assertTrue(supabase._event_children_rpc_available)
+
+    def test_fallback_insert_errors_propagate(self):
+        fake = FakeClient({
+            "rpc": APIError({"code": "PGRST202", "message": "not found"}),
+            "insert": APIError({"code": "23502", "message": "null value"}),
+        })
+        supabase = _make_client(fake)
+
+        with self.assertLogs("app.utils.supabase_client", level="WARNING"):
+            with self.assertRaises(APIError):
+                supabase.create_event_children(DAYS, VENDORS)
+
+
+if __name__ == "__main__":
+    unittest.main()